@@ -26,6 +26,7 @@ class UserAdmin(BaseUserAdmin):
 class DeviceAdmin(admin.ModelAdmin):
     model = Device
     list_display = ('user', 'platform', 'is_active', 'last_seen_at', 'created_at')
+    list_select_related = ('user',)
     list_filter = ('platform', 'is_active', 'created_at')
     search_fields = ('user__email', 'user__full_name', 'token')
     ordering = ('-created_at',)
@@ -41,6 +42,7 @@ class DeviceAdmin(admin.ModelAdmin):
 class PushNotificationLogAdmin(admin.ModelAdmin):
     """Admin interface for push notification logs."""
     list_display = ('id', 'recipient', 'notification_type', 'status', 'title', 'queued_at', 'sent_at')
+    list_select_related = ('recipient',)
     list_filter = ('notification_type', 'status', 'queued_at')
     search_fields = ('recipient__email', 'recipient__full_name', 'title', 'body')
     ordering = ('-queued_at',)
@@ -145,7 +145,9 @@ def incident_detail(request, incident_id):
                     incident.resolved_at = timezone.now()
                     incident.resolution_notes = resolution_notes
                     incident.resolution_type = resolution_type
-                    incident.save()
+                    incident.save(update_fields=[
+                        'status', 'resolved_by', 'resolved_at', 'resolution_notes', 'resolution_type', 'updated_at',
+                    ])
 
                     # Deactivate any active assignment
                     GuardAssignment.objects.filter(incident=incident, is_active=True).update(is_active=False)
@@ -224,14 +226,14 @@ def incident_detail(request, incident_id):
                 return redirect('adminEnd:incident_detail', incident_id=incident.id)
 
     # Gather related objects
-    images_qs = incident.images.all()
+    images_qs = incident.images.order_by('uploaded_at')
 
     # Resolve image URLs safely — accessing `.image.url` can trigger GCS auth.
     images_info = []
     gcs_credentials_missing = False
     for img in images_qs:
         try:
-            url = img.image.url
+            url = img.preview_url
         except DefaultCredentialsError:
             url = None
             gcs_credentials_missing = True
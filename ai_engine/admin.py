@@ -3,9 +3,18 @@ from django.utils.html import format_html
 from .models import AIEvent
 
 
+PRIORITY_COLORS = {
+    1: '#ffc107',  # LOW - yellow
+    2: '#17a2b8',  # MEDIUM - blue
+    3: '#fd7e14',  # HIGH - orange
+    4: '#dc3545',  # CRITICAL - red
+}
+
+
 @admin.register(AIEvent)
 class AIEventAdmin(admin.ModelAdmin):
     list_display = ('beacon', 'event_type', 'confidence_score', 'get_description', 'image_count_display', 'incident_created', 'created_at')
+    list_select_related = ('beacon',)
     list_filter = ('event_type', 'created_at', 'beacon__building')
     search_fields = ('beacon__location_name', 'beacon__uuid', 'beacon__beacon_id', 'details__description')
     ordering = ('-created_at',)
@@ -74,13 +83,7 @@ class AIEventAdmin(admin.ModelAdmin):
             if signal:
                 incident = signal.incident
                 incident_url = f'/admin/incidents/incident/{incident.id}/change/'
-                priority_colors = {
-                    1: '#ffc107',  # LOW - yellow
-                    2: '#17a2b8',  # MEDIUM - blue
-                    3: '#fd7e14',  # HIGH - orange
-                    4: '#dc3545',  # CRITICAL - red
-                }
-                color = priority_colors.get(incident.priority, '#999')
+                color = PRIORITY_COLORS.get(incident.priority, '#999')
                 return format_html(
                     '<a href="{}" style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; text-decoration: none; font-weight: bold;">🔴 {}</a>',
                     incident_url,
@@ -0,0 +1,30 @@
+"""
+DRF renderers for the API.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes compact responses with orjson.
+
+    Types orjson can't handle natively (Decimal, lazy strings, querysets)
+    go through DRF's own encoder, and so do datetimes, dates and times, so
+    they keep DRF's format (millisecond precision, "Z" for UTC). Indented
+    output, as requested by the browsable API, is left to the stdlib
+    encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        # Escaped like JSONRenderer does, so the output is also valid JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import os
 import sys
+import tempfile
 from decouple import config
 
 # Load .env file
@@ -172,11 +173,32 @@ STORAGES = {
 MEDIA_ROOT = BASE_DIR / 'media'
 MEDIA_URL = '/media/'
 
+# Set once the media bucket grants public read itself (see the
+# make_bucket_public command); uploads then skip per-object make_public().
+GCS_BUCKET_PUBLIC_READ = config('GCS_BUCKET_PUBLIC_READ', default='False')
+GCS_BUCKET_PUBLIC_READ = str(GCS_BUCKET_PUBLIC_READ).lower() in ('1', 'true', 'yes', 'on')
+
 # File upload settings
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
 FILE_UPLOAD_PERMISSIONS = 0o644
 
+# ---------------------------------------------------------------------------
+# Caches — per-process memory by default. 'gcs_probe' is file based so
+# maintenance scripts like fix_missing_images.py can reuse GCS existence
+# checks across reruns.
+# ---------------------------------------------------------------------------
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'gcs_probe': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'resq_gcs_probe'),
+        'TIMEOUT': 300,
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -190,6 +212,10 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.TokenAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'campus_security.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
 }
@@ -198,6 +224,11 @@ REST_FRAMEWORK = {
 ADMINEND_VIEW_ONLY = config('ADMINEND_VIEW_ONLY', default='False')
 ADMINEND_VIEW_ONLY = str(ADMINEND_VIEW_ONLY).lower() in ('1', 'true', 'yes', 'on')
 
+# Show the image count column on the Django admin incident changelist.
+# Turning this off also drops its COUNT aggregate from the changelist query.
+ADMIN_SHOW_INCIDENT_COUNTS = config('ADMIN_SHOW_INCIDENT_COUNTS', default='True')
+ADMIN_SHOW_INCIDENT_COUNTS = str(ADMIN_SHOW_INCIDENT_COUNTS).lower() in ('1', 'true', 'yes', 'on')
+
 # ---------------------------------------------------------------------------
 # Logging — output everything to stdout so Render captures it in the log tab.
 # ---------------------------------------------------------------------------
@@ -0,0 +1,27 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json_renderer(self):
+        data = {
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'assigned_at': datetime.datetime(2026, 1, 1, 10, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+            'resolved_at': datetime.datetime(2026, 1, 1, 11, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=5, minutes=30))),
+            'naive_at': datetime.datetime(2026, 1, 1, 10, 0, 0, 5000),
+            'date': datetime.date(2026, 1, 1),
+            'time': datetime.time(10, 15, 30, 250000),
+            'distance_km': Decimal('1.25'),
+            'nested': [{'guard': {'id': '7', 'full_name': 'Guard'}, 'rank': 1, 'score': 0.5, 'note': None}],
+            'text': 'Ünïcode \u2028 line',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -5,6 +5,7 @@ from .models import Conversation, Message
 @admin.register(Conversation)
 class ConversationAdmin(admin.ModelAdmin):
     list_display = ('incident', 'created_at', 'updated_at')
+    list_select_related = ('incident__beacon',)
     list_filter = ('created_at',)
     search_fields = ('incident__id', 'incident__beacon__uuid')
     ordering = ('-created_at',)
@@ -26,6 +27,7 @@ class MessageInline(admin.TabularInline):
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     list_display = ('id', 'conversation', 'sender', 'created_at')
+    list_select_related = ('conversation__incident', 'sender')
     list_filter = ('created_at', 'sender')
     search_fields = ('conversation__incident__id', 'sender__email', 'message_text')
     ordering = ('-created_at',)
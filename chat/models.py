@@ -23,7 +23,7 @@ class Conversation(models.Model):
         ]
 
     def __str__(self):
-        return f"Conversation for Incident {str(self.incident.id)[:8]}"
+        return f"Conversation for Incident {str(self.incident_id)[:8]}"
 
 
 class Message(models.Model):
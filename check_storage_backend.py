@@ -1,14 +1,26 @@
 #!/usr/bin/env python
 import os
 import sys
-import django
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "campus_security.settings")
+
+# Phase 1: settings only. django.conf.settings loads the module lazily on
+# first attribute access, so no app registry is needed for these reads.
+from django.conf import settings
+print(f"Settings check:")
+print(f"  DEFAULT_FILE_STORAGE: {getattr(settings, 'DEFAULT_FILE_STORAGE', 'NOT SET')}")
+print(f"  MEDIA_ROOT: {getattr(settings, 'MEDIA_ROOT', 'NOT SET')}")
+print(f"  MEDIA_URL: {settings.MEDIA_URL}")
+print(f"  GS_BUCKET_NAME: {getattr(settings, 'GS_BUCKET_NAME', 'NOT SET')}")
+print(f"  GS_PROJECT_ID: {getattr(settings, 'GS_PROJECT_ID', 'NOT SET')}")
+
+# Phase 2: the storage check needs the full Django setup
+import django
 django.setup()
 
 from django.core.files.storage import default_storage
 
-print(f"Default storage backend:")
+print(f"\nDefault storage backend:")
 print(f"  Class: {default_storage.__class__.__module__}.{default_storage.__class__.__name__}")
 print(f"  Storage object: {default_storage}")
 
@@ -21,12 +33,3 @@ if isinstance(default_storage, GoogleCloudStorage):
 else:
     print(f"  ✗ NOT using GoogleCloudStorage")
     print(f"  This is the problem!")
-    
-# Check settings
-from django.conf import settings
-print(f"\nSettings check:")
-print(f"  DEFAULT_FILE_STORAGE: {settings.DEFAULT_FILE_STORAGE}")
-print(f"  MEDIA_ROOT: {getattr(settings, 'MEDIA_ROOT', 'NOT SET')}")
-print(f"  MEDIA_URL: {settings.MEDIA_URL}")
-print(f"  GS_BUCKET_NAME: {getattr(settings, 'GS_BUCKET_NAME', 'NOT SET')}")
-print(f"  GS_PROJECT_ID: {getattr(settings, 'GS_PROJECT_ID', 'NOT SET')}")
@@ -19,19 +19,28 @@ print("=" * 60)
 
 orphaned_ids = []
 
-# Check each image in database
-for img in IncidentImage.objects.all().order_by('-id'):
-    try:
-        blob = bucket.blob(img.image.name)
-        exists = blob.exists()
-        
-        if not exists:
-            print(f"✗ Orphaned: ID {img.id}, Path: {img.image.name}")
-            orphaned_ids.append(img.id)
-        else:
-            print(f"✓ Valid: ID {img.id}, Path: {img.image.name}")
-    except Exception as e:
-        print(f"? Error checking ID {img.id}: {e}")
+# Check images in database against one listing of the bucket
+# (a page per 1000 objects) instead of a request per image
+images = list(IncidentImage.objects.order_by('-id').values_list('id', 'image'))
+names = [name for _, name in images if name]
+
+try:
+    existing = {
+        blob.name
+        for blob in bucket.list_blobs(prefix=os.path.commonprefix(names), fields='items(name),nextPageToken')
+    } if names else set()
+except Exception as e:
+    print(f"? Error listing bucket: {e}")
+    sys.exit(1)
+
+for img_id, name in images:
+    if not name:
+        continue
+    if name in existing:
+        print(f"✓ Valid: ID {img_id}, Path: {name}")
+    else:
+        print(f"✗ Orphaned: ID {img_id}, Path: {name}")
+        orphaned_ids.append(img_id)
 
 print(f"\nFound {len(orphaned_ids)} orphaned records: {orphaned_ids}")
 
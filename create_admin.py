@@ -5,15 +5,23 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'campus_security.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from accounts.models import User
 
-# Create superuser
-if not User.objects.filter(email='admin@resq.local').exists():
-    User.objects.create_superuser(
-        email='admin@resq.local',
-        password='admin123',
-        full_name='Admin User'
-    )
+# Create superuser (single lookup, INSERT only when missing). The password
+# default is a callable so the hasher only runs when the user is created.
+admin_user, created = User.objects.get_or_create(
+    email='admin@resq.local',
+    defaults={
+        'password': lambda: make_password('admin123'),
+        'full_name': 'Admin User',
+        'role': User.Role.ADMIN,
+        'is_staff': True,
+        'is_superuser': True,
+        'is_active': True,
+    }
+)
+if created:
     print("✓ Superuser created")
     print("✓ Email: admin@resq.local")
     print("✓ Password: admin123")
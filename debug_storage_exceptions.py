@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import logging
 import os
 import sys
 from pathlib import Path
@@ -7,29 +8,55 @@ from pathlib import Path
 creds_path = Path(__file__).resolve().parent / 'credentials' / 'gen-lang-client-0117249847-eb5558a80732.json'
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(creds_path)
 
+# Trace output is debug level; run with RESQ_LOG=DEBUG to see it
+logging.basicConfig(level=os.environ.get('RESQ_LOG', 'INFO'), format='%(message)s')
+log = logging.getLogger('resq.storage.debug')
+# Set on the logger itself: django.setup() resets the root level from LOGGING
+log.setLevel(os.environ.get('RESQ_LOG', 'INFO'))
+
 import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "campus_security.settings")
 
-# Patch the storage handler to catch exceptions
 from django.core.files.storage.handler import StorageHandler
 
-original_getitem = StorageHandler.__getitem__
 
-def patched_getitem(self, alias):
-    print(f"\n[PATCH] StorageHandler.__getitem__('{alias}') called")
-    print(f"  Current _storages: {self._storages}")
-    
-    try:
-        result = original_getitem(self, alias)
-        print(f"  Result: {result}")
-        return result
-    except Exception as e:
-        print(f"  ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        raise
+class PatchedHandler:
+    """
+    Trace StorageHandler.__getitem__ only inside the ``with`` block.
+
+    Trace records are written straight to stdout, in line with the
+    script's own output, and lookups outside the block run the original
+    method untouched. Below DEBUG level the wrapper skips formatting
+    entirely.
+    """
+
+    def __enter__(self):
+        self._original = StorageHandler.__getitem__
+        original = self._original
+
+        def patched_getitem(handler, alias):
+            log.debug("\n[PATCH] StorageHandler.__getitem__('%s') called", alias)
+            log.debug("  Current _storages: %s", handler._storages)
+            try:
+                result = original(handler, alias)
+                log.debug("  Result: %s", result)
+                return result
+            except Exception as e:
+                log.debug("  ERROR: %s", e, exc_info=True)
+                raise
+
+        self._handler = logging.StreamHandler(sys.stdout)
+        log.addHandler(self._handler)
+        log.propagate = False
+        StorageHandler.__getitem__ = patched_getitem
+        return self
+
+    def __exit__(self, *exc_info):
+        StorageHandler.__getitem__ = self._original
+        log.removeHandler(self._handler)
+        log.propagate = True
+        return False
 
-StorageHandler.__getitem__ = patched_getitem
 
 # Now setup Django
 print("Setting up Django...")
@@ -44,8 +71,9 @@ print("Accessing default_storage...")
 print("=" * 60)
 
 try:
-    print(f"default_storage = {default_storage}")
-    print(f"Type: {type(default_storage).__name__}")
+    with PatchedHandler():
+        print(f"default_storage = {default_storage}")
+        print(f"Type: {type(default_storage).__name__}")
 except Exception as e:
     print(f"Error: {e}")
     import traceback
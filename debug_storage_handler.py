@@ -4,40 +4,47 @@ import sys
 import logging
 from pathlib import Path
 
-# Enable detailed logging
-logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
+# Trace output is debug level; run with RESQ_LOG=DEBUG to see it
+logging.basicConfig(level=os.environ.get('RESQ_LOG', 'INFO'), format='%(levelname)s: %(message)s')
+log = logging.getLogger('resq.storage.debug')
+# Set on the logger itself: django.setup() resets the root level from LOGGING
+log.setLevel(os.environ.get('RESQ_LOG', 'INFO'))
 
 # Set GCS credentials
 creds_path = Path(__file__).resolve().parent / 'credentials' / 'gen-lang-client-0117249847-eb5558a80732.json'
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(creds_path)
 
-# Monkey patch django's storage handler to log what's happening
-original_handler_init = None
-
-def patch_storage_handler():
-    from django.core.files.storage.handler import StorageHandler
-    global original_handler_init
-    original_handler_init = StorageHandler.__init__
-    
-    def new_init(self, *args, **kwargs):
-        print(f"[PATCH] StorageHandler.__init__ called")
-        result = original_handler_init(self, *args, **kwargs)
-        print(f"[PATCH] StorageHandler initialized, _storages: {self._storages if hasattr(self, '_storages') else 'N/A'}")
-        return result
+# Patch django's storage handler to log what's happening, but only while
+# the handler is being built; the original __init__ is restored on exit.
+class PatchedHandlerInit:
+    def __enter__(self):
+        from django.core.files.storage.handler import StorageHandler
+        self._handler_cls = StorageHandler
+        self._original_init = original_init = StorageHandler.__init__
+        
+        def new_init(handler, *args, **kwargs):
+            log.debug("[PATCH] StorageHandler.__init__ called")
+            result = original_init(handler, *args, **kwargs)
+            log.debug("[PATCH] StorageHandler initialized, _storages: %s", getattr(handler, '_storages', 'N/A'))
+            return result
+        
+        StorageHandler.__init__ = new_init
+        return self
     
-    StorageHandler.__init__ = new_init
-
-patch_storage_handler()
+    def __exit__(self, *exc_info):
+        self._handler_cls.__init__ = self._original_init
+        return False
 
 import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "campus_security.settings")
 
-print("\n[DJANGO SETUP] Starting Django setup...")
-django.setup()
-print("[DJANGO SETUP] Django setup complete\n")
-
-from django.conf import settings
-from django.core.files.storage import storages, default_storage
+with PatchedHandlerInit():
+    print("\n[DJANGO SETUP] Starting Django setup...")
+    django.setup()
+    print("[DJANGO SETUP] Django setup complete\n")
+    
+    from django.conf import settings
+    from django.core.files.storage import storages, default_storage
 
 print("=" * 60)
 print("STORAGE CONFIGURATION STATUS")
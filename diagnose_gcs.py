@@ -36,6 +36,7 @@ else:
 
 # Check 2: Try to load Google credentials
 print("\n[2] LOADING GOOGLE CREDENTIALS")
+credentials = None
 try:
     from google.oauth2 import service_account
     from google.auth.transport.requests import Request
@@ -61,9 +62,8 @@ except Exception as e:
 # Check 3: Django configuration
 print("\n[3] DJANGO CONFIGURATION")
 try:
-    import django
+    # Settings are read lazily; the app registry is only needed for [5]
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'campus_security.settings')
-    django.setup()
     
     from django.conf import settings
     print(f"  DEFAULT_FILE_STORAGE: {settings.DEFAULT_FILE_STORAGE}")
@@ -80,8 +80,12 @@ try:
     from google.cloud import storage
     from io import BytesIO
     
-    # Use default credentials from environment
-    client = storage.Client()
+    # Reuse the credentials refreshed in [2] so the client doesn't repeat
+    # auth discovery and the token fetch; fall back to the environment
+    if credentials is not None:
+        client = storage.Client(credentials=credentials, project=credentials.project_id)
+    else:
+        client = storage.Client()
     bucket = client.bucket('resq-campus-security')
     
     print(f"  ✓ GCS client initialized")
@@ -113,6 +117,10 @@ except Exception as e:
 # Check 5: Test django-storages
 print("\n[5] TEST DJANGO-STORAGES UPLOAD")
 try:
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'campus_security.settings')
+    django.setup()
+    
     from django.core.files.base import File
     from django.core.files.storage import default_storage
     from io import BytesIO
@@ -5,34 +5,46 @@ Run this to make all existing incident images publicly readable:
     python manage.py shell < fix_image_permissions.py
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from incidents.models import IncidentImage
 from django.core.files.storage import default_storage
 
+# make_public() is one blocking ACL request per blob; run them side by side.
+# Kept near the HTTP connection pool size so workers don't queue on sockets.
+MAX_WORKERS = 16
+
+
+def _make_public(name):
+    """Make a single blob public using the shared storage bucket."""
+    default_storage.bucket.blob(name).make_public()
+    return name
+
+
 def fix_image_permissions():
     """Make all existing incident images public on GCS."""
     
-    images = IncidentImage.objects.all()
-    total = images.count()
+    names = [
+        name for name in IncidentImage.objects.values_list('image', flat=True)
+        if name
+    ]
+    total = len(names)
     success = 0
     failed = 0
     
     print(f"\nFixing permissions for {total} incident images...\n")
     
-    for image in images:
-        try:
-            if image.image:
-                # Get the storage backend
-                storage = image.image.storage
-                blob = storage.bucket.blob(image.image.name)
-                
-                # Make blob publicly readable
-                blob.make_public()
-                
-                print(f"✓ Made public: {image.image.name}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_make_public, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+                print(f"✓ Made public: {name}")
                 success += 1
-        except Exception as e:
-            print(f"✗ Failed: {image.image.name} - {str(e)}")
-            failed += 1
+            except Exception as e:
+                print(f"✗ Failed: {name} - {str(e)}")
+                failed += 1
     
     print(f"\n{'='*60}")
     print(f"Summary:")
@@ -8,6 +8,8 @@ Run to find and fix missing images:
 from incidents.models import IncidentImage
 from google.cloud import storage as gcs_storage
 from django.core.files.storage import default_storage
+from django.core.cache import caches
+import os
 
 def fix_missing_images():
     """Remove database records for images that don't exist in GCS."""
@@ -31,13 +33,39 @@ def fix_missing_images():
         orphaned = []
         valid = []
         
+        # Objects confirmed present on an earlier run are not probed again
+        probe_cache = caches['gcs_probe']
+        cache_keys = {
+            image.id: f"gcs-exists:{bucket.name}:{image.image.name}"
+            for image in images if image.image
+        }
+        known = probe_cache.get_many(cache_keys.values())
+        
+        to_check = []
         for image in images:
-            if image.image:
-                blob = bucket.blob(image.image.name)
-                if blob.exists():
+            if not image.image:
+                continue
+            if known.get(cache_keys[image.id]):
+                valid.append(image)
+            else:
+                to_check.append(image)
+        
+        # One listing of the bucket (a page per 1000 objects) instead of
+        # one exists() call per image
+        if to_check:
+            prefix = os.path.commonprefix([image.image.name for image in to_check])
+            existing = {
+                blob.name
+                for blob in bucket.list_blobs(prefix=prefix, fields='items(name),nextPageToken')
+            }
+            found = {}
+            for image in to_check:
+                if image.image.name in existing:
                     valid.append(image)
+                    found[cache_keys[image.id]] = True
                 else:
                     orphaned.append(image)
+            probe_cache.set_many(found)
         
         print(f"Found:")
         print(f"  Valid images in GCS: {len(valid)}")
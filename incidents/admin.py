@@ -1,10 +1,146 @@
+from django.conf import settings
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.db.models import Count, Prefetch, prefetch_related_objects
+from django.template.loader import render_to_string
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django import forms
+from django.forms.models import BaseInlineFormSet
+from ai_engine.models import AIEvent
 from .models import Beacon, BeaconProximity, PhysicalDevice, Incident, IncidentSignal, IncidentImage, IncidentEvent
+from .signals import BUZZER_CACHE_TIMEOUT, beacon_buzzer_cache_key
 
 
-class BeaconProximityInline(admin.TabularInline):
+ACTIVE_INCIDENT_STATUSES = [Incident.Status.CREATED, Incident.Status.ASSIGNED, Incident.Status.IN_PROGRESS]
+
+PRIORITY_COLORS = {
+    Incident.Priority.LOW: '#ffc107',       # Yellow
+    Incident.Priority.MEDIUM: '#17a2b8',    # Blue
+    Incident.Priority.HIGH: '#fd7e14',      # Orange
+    Incident.Priority.CRITICAL: '#dc3545',  # Red
+}
+
+PRIORITY_BADGE_HTML = '<span style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">{}</span>'
+
+# Like the buzzer badges below, priority badges are rendered once at import time
+PRIORITY_BADGES = {
+    priority: format_html(PRIORITY_BADGE_HTML, PRIORITY_COLORS[priority], priority.label)
+    for priority in Incident.Priority
+}
+
+# Choice labels keyed by raw value, for columns rendered on every changelist row
+AI_EVENT_TYPE_LABELS = dict(AIEvent.EventType.choices)
+
+AI_SIGNAL_TYPES = [IncidentSignal.SignalType.VIOLENCE_DETECTED, IncidentSignal.SignalType.SCREAM_DETECTED]
+
+BUZZER_STATUS_COLORS = {
+    Incident.BuzzerStatus.INACTIVE: '#28a745',      # Green
+    Incident.BuzzerStatus.PENDING: '#ffc107',        # Amber/Yellow
+    Incident.BuzzerStatus.ACTIVE: '#dc3545',         # Red
+    Incident.BuzzerStatus.ACKNOWLEDGED: '#fd7e14',   # Orange
+    Incident.BuzzerStatus.RESOLVED: '#6c757d',       # Gray
+}
+
+BUZZER_STATUS_ICONS = {
+    Incident.BuzzerStatus.INACTIVE: '✓',             # Check mark
+    Incident.BuzzerStatus.PENDING: '⏳',              # Hourglass
+    Incident.BuzzerStatus.ACTIVE: '🔴',              # Red dot
+    Incident.BuzzerStatus.ACKNOWLEDGED: '🟠',        # Orange dot
+    Incident.BuzzerStatus.RESOLVED: '✓',             # Check mark
+}
+
+BUZZER_BADGE_HTML = '<span style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">{} {}</span>'
+
+# Badges depend only on the status, so render each one once at import time.
+BUZZER_BADGES = {
+    status: format_html(BUZZER_BADGE_HTML, BUZZER_STATUS_COLORS[status], BUZZER_STATUS_ICONS[status], status.label)
+    for status in Incident.BuzzerStatus
+}
+
+BEACON_BUZZER_ON_HTML = format_html(
+    '<span style="background-color: #28a745; color: white; padding: 8px 12px; border-radius: 4px; font-weight: bold;">ON</span>'
+)
+BEACON_BUZZER_OFF_HTML = format_html(
+    '<span style="background-color: #dc3545; color: white; padding: 8px 12px; border-radius: 4px; font-weight: bold;">OFF</span>'
+)
+
+
+def _priority_badge(priority):
+    """Prebuilt priority badge, or a gray one for values outside Incident.Priority."""
+    badge = PRIORITY_BADGES.get(priority)
+    if badge is None:
+        return format_html(PRIORITY_BADGE_HTML, '#999', priority)
+    return badge
+
+
+class BuildingListFilter(admin.SimpleListFilter):
+    """
+    Filter by beacon building.
+
+    The default related-field filter runs a DISTINCT over the joined
+    table on every changelist load; the building list here is read from
+    the (small) beacon table alone.
+    """
+    title = 'building'
+    parameter_name = 'building'
+    field_path = 'beacon__building'
+
+    def lookups(self, request, model_admin):
+        buildings = Beacon.objects.order_by('building').values_list('building', flat=True).distinct()
+        return [(building, building) for building in buildings]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.field_path: self.value()})
+        return queryset
+
+
+class IncidentBuildingListFilter(BuildingListFilter):
+    field_path = 'incident__beacon__building'
+
+
+class FromBeaconBuildingListFilter(BuildingListFilter):
+    field_path = 'from_beacon__building'
+
+
+def _is_changelist(request):
+    """True when ``request`` is for a model's admin changelist page."""
+    match = getattr(request, 'resolver_match', None)
+    return bool(match and match.url_name and match.url_name.endswith('_changelist'))
+
+
+def _fk_dropdown_queryset(related_model):
+    """
+    Queryset for FK form fields pointing at ``related_model``.
+
+    Loads only what the related ``__str__`` renders, so select options
+    (and the selected value of autocomplete widgets) don't fetch the
+    related beacon once per row.
+    """
+    if related_model is Beacon:
+        return Beacon.objects.only('id', 'location_name', 'building', 'floor')
+    if related_model is Incident:
+        # __str__ reads the denormalized beacon_location_cache, not the beacon
+        return Incident.objects.only('id', 'status', 'beacon_location_cache')
+    if related_model is PhysicalDevice:
+        return PhysicalDevice.objects.select_related('beacon')
+    return None
+
+
+class FKDropdownMixin:
+    """Apply :func:`_fk_dropdown_queryset` to ForeignKey form fields."""
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if 'queryset' not in kwargs:
+            queryset = _fk_dropdown_queryset(db_field.related_model)
+            if queryset is not None:
+                kwargs['queryset'] = queryset
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+class BeaconProximityInline(FKDropdownMixin, admin.TabularInline):
     """Inline admin for managing nearby beacons from a beacon."""
     model = BeaconProximity
     fk_name = 'from_beacon'
@@ -13,20 +149,41 @@ class BeaconProximityInline(admin.TabularInline):
     ordering = ('priority',)
 
 
+class RecentRowsInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that only loads the newest ``max_rows`` related rows.
+
+    Incidents can collect many signals (AI event bursts) and images; the
+    full lists stay available from their own admin changelists.
+    """
+    max_rows = 25
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            self._queryset = super().get_queryset()[:self.max_rows]
+        return self._queryset
+
+
 class IncidentImageInline(admin.StackedInline):
     """Inline admin for displaying images attached to an incident."""
     model = IncidentImage
+    formset = RecentRowsInlineFormSet
+    ordering = ('-uploaded_at',)
     extra = 0  # Don't show empty add rows
     fields = ('image', 'image_preview', 'description', 'uploaded_by', 'uploaded_at')
     readonly_fields = ('image_preview', 'uploaded_by', 'uploaded_at')
     can_delete = True
     
+    def get_queryset(self, request):
+        # uploaded_by is rendered read-only (str(user)) on every row
+        return super().get_queryset(request).select_related('uploaded_by')
+    
     def image_preview(self, obj):
         """Show image preview in inline."""
         if obj.image:
             return format_html(
-                '<img src="{}" width="300" height="300" style="max-width: 100%; height: auto; object-fit: cover; border-radius: 5px;" />',
-                obj.image.url
+                '<img src="{}" width="300" height="300" loading="lazy" decoding="async" style="max-width: 100%; height: auto; object-fit: cover; border-radius: 5px;" />',
+                obj.preview_url
             )
         return "No image"
     image_preview.short_description = 'Preview'
@@ -48,8 +205,9 @@ class IncidentSignalInlineForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.instance and self.instance.pk:
-            # For existing signals, show description from details
-            self.fields['description'].initial = self.instance.details.get('description', '')
+            # For existing signals, show description from details (already
+            # extracted by the database into description_text)
+            self.fields['description'].initial = self.instance.description_text or ''
             self.fields['description'].widget.attrs['readonly'] = True
     
     def save(self, commit=True):
@@ -64,13 +222,55 @@ class IncidentSignalInlineForm(forms.ModelForm):
         return instance
 
 
-class IncidentSignalInline(admin.TabularInline):
+class IncidentSignalInline(FKDropdownMixin, admin.TabularInline):
     """Inline admin for displaying signals related to an incident."""
     model = IncidentSignal
     form = IncidentSignalInlineForm
-    extra = 1
+    formset = RecentRowsInlineFormSet
+    ordering = ('-created_at',)
+    extra = 0
     fields = ('signal_type', 'source_user', 'source_device', 'ai_event', 'description', 'created_at')
     readonly_fields = ('created_at',)
+    autocomplete_fields = ('source_user', 'source_device', 'ai_event')
+    
+    def get_queryset(self, request):
+        # Rows show description_text; details is only loaded for rows being saved
+        return super().get_queryset(request).defer('details')
+
+
+class BeaconChangeList(ChangeList):
+    """
+    Beacon changelist that resolves buzzer state for the whole page at once.
+
+    Buzzer state is cached per beacon for a few seconds (and dropped when an
+    incident at the beacon changes), so a monitoring console refreshing the
+    list only loads active incidents for beacons missing from the cache.
+    """
+
+    def get_results(self, request):
+        super().get_results(request)
+        beacons = list(self.result_list)
+        keys = {beacon.pk: beacon_buzzer_cache_key(beacon.pk) for beacon in beacons}
+        cached = cache.get_many(keys.values())
+        
+        misses = []
+        for beacon in beacons:
+            beacon._buzzer_on = cached.get(keys[beacon.pk])
+            if beacon._buzzer_on is None:
+                misses.append(beacon)
+        
+        if misses:
+            prefetch_related_objects(misses, Prefetch(
+                'incidents',
+                queryset=Incident.objects.filter(status__in=ACTIVE_INCIDENT_STATUSES).order_by('-created_at'),
+                to_attr='_active_incidents',
+            ))
+            for beacon in misses:
+                beacon._buzzer_on = self.model_admin._should_buzz(beacon)
+            cache.set_many(
+                {keys[beacon.pk]: beacon._buzzer_on for beacon in misses},
+                BUZZER_CACHE_TIMEOUT
+            )
 
 
 @admin.register(Beacon)
@@ -90,72 +290,61 @@ class BeaconAdmin(admin.ModelAdmin):
         ('Timestamps', {'fields': ('id', 'created_at', 'updated_at')}),
     )
     
-    def buzzer_status_display(self, obj):
-        """Display buzzer ON/OFF status - Green=ON, Red=OFF."""
-        active_incidents = obj.incidents.filter(
-            status__in=[Incident.Status.CREATED, Incident.Status.ASSIGNED, Incident.Status.IN_PROGRESS]
-        )
-        
-        if not active_incidents.exists():
-            return format_html(
-                '<span style="background-color: #dc3545; color: white; padding: 8px 12px; border-radius: 4px; font-weight: bold;">OFF</span>'
-            )
-        
-        # Get most recent incident
-        incident = active_incidents.order_by('-created_at').first()
-        
-        # Check if buzzer should be active
-        should_buzz = incident.buzzer_status in [
+    def get_changelist(self, request, **kwargs):
+        return BeaconChangeList
+    
+    def _get_active_incidents(self, obj):
+        """Active incidents at this beacon, newest first."""
+        if hasattr(obj, '_active_incidents'):
+            return obj._active_incidents
+        if obj._state.adding:
+            return []
+        return list(obj.incidents.filter(status__in=ACTIVE_INCIDENT_STATUSES).order_by('-created_at'))
+    
+    def _should_buzz(self, obj):
+        """True when the newest active incident at this beacon is still alarming."""
+        if hasattr(obj, '_active_incidents'):
+            buzzer_status = obj._active_incidents[0].buzzer_status if obj._active_incidents else None
+        elif obj._state.adding:
+            buzzer_status = None
+        else:
+            # Single LIMIT 1 query served by the (beacon, status, -created_at) index
+            buzzer_status = obj.incidents.filter(
+                status__in=ACTIVE_INCIDENT_STATUSES
+            ).order_by('-created_at').values_list('buzzer_status', flat=True).first()
+        if buzzer_status is None:
+            return False
+        return buzzer_status in [
             Incident.BuzzerStatus.PENDING,
             Incident.BuzzerStatus.ACTIVE
         ]
+    
+    def buzzer_status_display(self, obj):
+        """Display buzzer ON/OFF status - Green=ON, Red=OFF."""
+        should_buzz = getattr(obj, '_buzzer_on', None)
+        if should_buzz is None:
+            should_buzz = self._should_buzz(obj)
         
-        if should_buzz:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; padding: 8px 12px; border-radius: 4px; font-weight: bold;">ON</span>'
-            )
-        else:
-            return format_html(
-                '<span style="background-color: #dc3545; color: white; padding: 8px 12px; border-radius: 4px; font-weight: bold;">OFF</span>'
-            )
+        return BEACON_BUZZER_ON_HTML if should_buzz else BEACON_BUZZER_OFF_HTML
     buzzer_status_display.short_description = 'Buzzer'
     
     def active_incidents_display(self, obj):
         """Display all active incidents at this beacon with clickable links."""
-        active_incidents = obj.incidents.filter(
-            status__in=[Incident.Status.CREATED, Incident.Status.ASSIGNED, Incident.Status.IN_PROGRESS]
-        ).order_by('-created_at')
-        
-        if not active_incidents.exists():
-            return '<p style="color: #28a745;"><strong>✓ No active incidents at this beacon</strong></p>'
-        
-        html = '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px;"><strong>Active Incidents:</strong><br><br>'
-        
-        for incident in active_incidents:
-            status_emoji = '🔴' if incident.buzzer_status in [Incident.BuzzerStatus.PENDING, Incident.BuzzerStatus.ACTIVE] else '✓'
-            
-            incident_url = f'/admin/incidents/incident/{incident.id}/change/'
-            html += f'''
-            <div style="background: white; padding: 8px; margin: 5px 0; border-left: 4px solid #007bff;">
-                {status_emoji} <a href="{incident_url}" style="color: #007bff; text-decoration: none;"><strong>{str(incident.id)[:8]}...</strong></a>
-                <br>
-                <small>Status: <strong>{incident.get_status_display()}</strong> | Priority: <strong>{incident.priority}</strong></small>
-                <br>
-                <small>Buzzer: <strong style="color: #dc3545;">{incident.get_buzzer_status_display()}</strong> | Created: <strong>{incident.created_at.strftime('%Y-%m-%d %H:%M')}</strong></small>
-            </div>
-            '''
-        
-        html += '</div>'
-        return format_html(html)
+        return render_to_string(
+            'admin/incidents/_active_incidents.html',
+            {'incidents': self._get_active_incidents(obj)}
+        )
     active_incidents_display.short_description = '📊 Active Incidents & Buzzer Status'
 
 
 @admin.register(PhysicalDevice)
-class PhysicalDeviceAdmin(admin.ModelAdmin):
+class PhysicalDeviceAdmin(FKDropdownMixin, admin.ModelAdmin):
     list_display = ('device_id', 'device_type', 'name', 'beacon', 'is_active', 'created_at')
-    list_filter = ('device_type', 'is_active', 'beacon__building', 'created_at')
+    list_select_related = ('beacon',)
+    list_filter = ('device_type', 'is_active', BuildingListFilter, 'created_at')
     search_fields = ('device_id', 'name', 'beacon__location_name')
     ordering = ('device_id',)
+    autocomplete_fields = ('beacon',)
     readonly_fields = ('id', 'created_at', 'updated_at')
     fieldsets = (
         ('Device Info', {'fields': ('device_id', 'device_type', 'name')}),
@@ -166,13 +355,15 @@ class PhysicalDeviceAdmin(admin.ModelAdmin):
 
 
 @admin.register(Incident)
-class IncidentAdmin(admin.ModelAdmin):
+class IncidentAdmin(FKDropdownMixin, admin.ModelAdmin):
     list_display = ('id', 'beacon_id', 'beacon_location', 'status', 'priority_display', 'has_ai_detection', 'image_count_display', 'signal_count', 'buzzer_status_display', 'created_at')
-    list_filter = ('status', 'priority', 'buzzer_status', 'report_type', 'resolution_type', 'created_at', 'beacon__building')
-    search_fields = ('id', 'beacon__location_name', 'beacon__beacon_id', 'description', 'location', 'report_type')
+    list_select_related = ('beacon',)
+    list_filter = ('status', 'priority', 'buzzer_status', 'report_type', 'resolution_type', 'created_at', BuildingListFilter)
+    search_fields = ('id', 'beacon_search', 'description', 'location', 'report_type')
     ordering = ('-created_at',)
     readonly_fields = ('id', 'first_signal_time', 'last_signal_time', 'created_at', 'updated_at', 'total_alerts_sent', 'total_alerts_declined', 'buzzer_last_updated', 'ai_detection_info', 'images_summary')
     inlines = [IncidentSignalInline, IncidentImageInline]
+    autocomplete_fields = ('beacon', 'current_assigned_guard', 'resolved_by')
     fieldsets = (
         ('Location', {'fields': ('beacon', 'location')}),
         ('Report Info', {'fields': ('report_type', 'description')}),
@@ -189,29 +380,77 @@ class IncidentAdmin(admin.ModelAdmin):
         ('Timestamps', {'fields': ('first_signal_time', 'last_signal_time', 'created_at', 'updated_at')}),
     )
     
+    # Columns the changelist actually renders (plus beacon_location_cache for
+    # Incident.__str__); the wide text fields are left out
+    changelist_only_fields = (
+        'id', 'beacon', 'status', 'priority', 'buzzer_status', 'signal_count', 'created_at',
+        'beacon_location_cache', 'beacon__beacon_id', 'beacon__location_name',
+    )
+    
+    count_columns = ('image_count_display',)
+    
+    def get_list_display(self, request):
+        list_display = super().get_list_display(request)
+        if not settings.ADMIN_SHOW_INCIDENT_COUNTS:
+            list_display = tuple(name for name in list_display if name not in self.count_columns)
+        return list_display
+    
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if settings.ADMIN_SHOW_INCIDENT_COUNTS:
+            # Count images in the changelist query instead of per row;
+            # signals are counted in Incident.signal_count
+            queryset = queryset.annotate(_image_count=Count('images', distinct=True))
+        if _is_changelist(request):
+            queryset = queryset.select_related('beacon').only(*self.changelist_only_fields)
+            # has_ai_detection reads these instead of querying signals per row
+            queryset = queryset.prefetch_related(Prefetch(
+                'signals',
+                queryset=IncidentSignal.objects.filter(
+                    signal_type__in=AI_SIGNAL_TYPES
+                ).select_related('ai_event').defer('details').order_by('-created_at'),
+                to_attr='_ai_signals',
+            ))
+        return queryset
+    
+    def _ai_signals(self, obj):
+        """AI-detection signals for this incident, newest first."""
+        if not hasattr(obj, '_ai_signals'):
+            obj._ai_signals = list(
+                obj.signals.filter(signal_type__in=AI_SIGNAL_TYPES).select_related('ai_event').order_by('-created_at')
+            )
+        return obj._ai_signals
+    
+    def _beacon(self, obj):
+        """The row's beacon (joined by list_select_related), or None."""
+        return obj.beacon if obj.beacon_id else None
+    
     def beacon_id(self, obj):
-        return obj.beacon.beacon_id if obj.beacon else "N/A"
+        beacon = self._beacon(obj)
+        return beacon.beacon_id if beacon else "N/A"
     beacon_id.short_description = 'Beacon ID'
     
     def beacon_location(self, obj):
-        return obj.beacon.location_name if obj.beacon else "N/A"
+        beacon = self._beacon(obj)
+        return beacon.location_name if beacon else "N/A"
     beacon_location.short_description = 'Location'
     
     def signal_count(self, obj):
-        count = obj.signals.count()
         return format_html(
             '<span style="background: #17a2b8; color: white; padding: 3px 8px; border-radius: 3px; font-weight: bold;">📡 {}</span>',
-            count
+            obj.signal_count
         )
     signal_count.short_description = 'Signals'
+    signal_count.admin_order_field = 'signal_count'
     
     def image_count(self, obj):
-        return obj.images.count()
+        return obj._image_count
     image_count.short_description = 'Images'
+    image_count.admin_order_field = '_image_count'
     
     def image_count_display(self, obj):
         """Display image count with indicator."""
-        count = obj.images.count()
+        count = obj._image_count
         if count > 0:
             return format_html(
                 '<span style="background: #28a745; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">📷 {} image{}</span>',
@@ -220,146 +459,117 @@ class IncidentAdmin(admin.ModelAdmin):
             )
         return format_html('<span style="color: #999;">No images</span>')
     image_count_display.short_description = '📷 Images'
+    image_count_display.admin_order_field = '_image_count'
     
     def has_ai_detection(self, obj):
         """Check if this incident was triggered by AI detection."""
-        ai_signals = obj.signals.filter(
-            signal_type__in=['VIOLENCE_DETECTED', 'SCREAM_DETECTED']
-        )
-        if ai_signals.exists():
-            signal = ai_signals.first()
+        ai_signals = self._ai_signals(obj)
+        if ai_signals:
+            signal = ai_signals[0]
             if signal.ai_event:
                 return format_html(
                     '<span style="background: #6f42c1; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">🤖 AI: {}</span>',
-                    signal.ai_event.get_event_type_display()
+                    AI_EVENT_TYPE_LABELS.get(signal.ai_event.event_type, signal.ai_event.event_type)
                 )
         return format_html('<span style="color: #999;">Manual Report</span>')
     has_ai_detection.short_description = '🤖 AI Detection'
     
     def ai_detection_info(self, obj):
         """Display AI detection information if this incident was triggered by AI."""
-        ai_signals = obj.signals.filter(
-            signal_type__in=['VIOLENCE_DETECTED', 'SCREAM_DETECTED']
-        )
+        ai_signals = self._ai_signals(obj)
         
-        if not ai_signals.exists():
+        if not ai_signals:
             return format_html(
                 '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px; color: #999;">'
                 'This incident was created manually, not by AI detection.'
                 '</div>'
             )
         
-        html = '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px;">'
-        
+        detections = []
         for signal in ai_signals:
             if signal.ai_event:
                 ai = signal.ai_event
-                confidence_color = '#28a745' if ai.confidence_score >= 0.8 else '#ffc107' if ai.confidence_score >= 0.75 else '#dc3545'
-                
-                html += f'''
-                <div style="background: white; padding: 10px; margin: 5px 0; border-left: 4px solid {confidence_color}; border-radius: 3px;">
-                    <strong>🤖 AI Event #{ai.id}</strong><br>
-                    <strong>Type:</strong> {ai.get_event_type_display()}<br>
-                    <strong>Confidence:</strong> <span style="background: {confidence_color}; color: white; padding: 3px 6px; border-radius: 3px;">{ai.confidence_score:.1%}</span><br>
-                    <strong>Device:</strong> {ai.details.get('device_id', 'Unknown')}<br>
-                    <strong>Description:</strong> {ai.details.get('description', 'N/A')}<br>
-                    <strong>Detected:</strong> {ai.created_at.strftime('%Y-%m-%d %H:%M:%S')}
-                </div>
-                '''
+                detections.append({
+                    'ai': ai,
+                    'color': '#28a745' if ai.confidence_score >= 0.8 else '#ffc107' if ai.confidence_score >= 0.75 else '#dc3545',
+                    'confidence': f'{ai.confidence_score:.1%}',
+                    'device_id': ai.details.get('device_id', 'Unknown'),
+                    'description': ai.details.get('description', 'N/A'),
+                })
         
-        html += '</div>'
-        return format_html(html)
+        # Rendered through a template so AI-supplied details are escaped
+        return render_to_string('admin/incidents/_ai_detection_info.html', {'detections': detections})
     ai_detection_info.short_description = '🤖 AI Detection Details'
     
     def images_summary(self, obj):
         """Display summary of images attached to this incident."""
-        images = obj.images.all().order_by('-uploaded_at')
+        # One query for every image (and its uploader); counts come from the list
+        images = list(obj.images.select_related('uploaded_by').order_by('-uploaded_at'))
+        total = len(images)
         
-        if not images.exists():
+        if not images:
             return format_html(
                 '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px; color: #999;">'
                 'No images attached to this incident.'
                 '</div>'
             )
         
-        html = '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px;">'
-        html += f'<strong>📷 {images.count()} image{"s" if images.count() != 1 else ""} attached:</strong><br><br>'
+        # Collect escaped fragments and join once instead of growing one string
+        parts = [format_html(
+            '<div style="background: #f5f5f5; padding: 10px; border-radius: 5px;">'
+            '<strong>📷 {} image{} attached:</strong><br><br>',
+            total,
+            's' if total != 1 else ''
+        )]
         
         for img in images[:5]:  # Show first 5
             source = '🤖 AI Detection' if not img.uploaded_by else f'👤 {img.uploaded_by.email}'
             try:
                 url = img.image.url
-                html += f'''
-                <div style="background: white; padding: 8px; margin: 5px 0; border-left: 4px solid #28a745; border-radius: 3px;">
-                    <strong>#{img.id}</strong> - {source}<br>
-                    <small>{img.uploaded_at.strftime('%Y-%m-%d %H:%M:%S')}</small><br>
-                    <a href="{url}" target="_blank" style="color: #007bff; text-decoration: none; font-size: 12px;">📥 View Full Image</a>
-                </div>
-                '''
+                parts.append(format_html(
+                    '<div style="background: white; padding: 8px; margin: 5px 0; border-left: 4px solid #28a745; border-radius: 3px;">'
+                    '<strong>#{}</strong> - {}<br>'
+                    '<small>{}</small><br>'
+                    '<a href="{}" target="_blank" style="color: #007bff; text-decoration: none; font-size: 12px;">📥 View Full Image</a>'
+                    '</div>',
+                    img.id,
+                    source,
+                    img.uploaded_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    url
+                ))
             except Exception as e:
-                html += f'<div style="color: #dc3545;">Error: {str(e)}</div>'
+                parts.append(format_html('<div style="color: #dc3545;">Error: {}</div>', e))
         
-        if images.count() > 5:
-            html += f'<div style="color: #999; margin-top: 10px;">... and {images.count() - 5} more</div>'
+        if total > 5:
+            parts.append(format_html('<div style="color: #999; margin-top: 10px;">... and {} more</div>', total - 5))
         
-        html += '</div>'
-        return format_html(html)
+        parts.append(mark_safe('</div>'))
+        return mark_safe(''.join(parts))
     images_summary.short_description = '📷 Images Summary'
     
     def priority_display(self, obj):
         """Display priority with color."""
-        priority_colors = {
-            1: '#ffc107',  # LOW - yellow
-            2: '#17a2b8',  # MEDIUM - blue
-            3: '#fd7e14',  # HIGH - orange
-            4: '#dc3545',  # CRITICAL - red
-        }
-        color = priority_colors.get(obj.priority, '#999')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">{}</span>',
-            color,
-            obj.get_priority_display()
-        )
+        return _priority_badge(obj.priority)
     priority_display.short_description = '⚠️ Priority'
     
     def buzzer_status_display(self, obj):
         """Display buzzer status with color indicator."""
-        status_colors = {
-            Incident.BuzzerStatus.INACTIVE: '#28a745',      # Green
-            Incident.BuzzerStatus.PENDING: '#ffc107',        # Amber/Yellow
-            Incident.BuzzerStatus.ACTIVE: '#dc3545',         # Red
-            Incident.BuzzerStatus.ACKNOWLEDGED: '#fd7e14',   # Orange
-            Incident.BuzzerStatus.RESOLVED: '#6c757d',       # Gray
-        }
-        
-        status_icons = {
-            Incident.BuzzerStatus.INACTIVE: '✓',             # Check mark
-            Incident.BuzzerStatus.PENDING: '⏳',              # Hourglass
-            Incident.BuzzerStatus.ACTIVE: '🔴',              # Red dot
-            Incident.BuzzerStatus.ACKNOWLEDGED: '🟠',        # Orange dot
-            Incident.BuzzerStatus.RESOLVED: '✓',             # Check mark
-        }
-        
-        color = status_colors.get(obj.buzzer_status, '#999')
-        icon = status_icons.get(obj.buzzer_status, '?')
-        
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">{} {}</span>',
-            color,
-            icon,
-            obj.get_buzzer_status_display()
-        )
+        badge = BUZZER_BADGES.get(obj.buzzer_status)
+        if badge is None:
+            return format_html(BUZZER_BADGE_HTML, '#999', '?', obj.get_buzzer_status_display())
+        return badge
     buzzer_status_display.short_description = '🔔 Buzzer'
 
 
 @admin.register(BeaconProximity)
-class BeaconProximityAdmin(admin.ModelAdmin):
+class BeaconProximityAdmin(FKDropdownMixin, admin.ModelAdmin):
     """
     Admin interface for managing beacon proximity relationships.
     Used for expanding-radius guard search in incident assignment.
     """
     list_display = ('from_beacon', 'to_beacon', 'priority')
-    list_filter = ('priority', 'from_beacon__building')
+    list_select_related = ('from_beacon', 'to_beacon')
+    list_filter = ('priority', FromBeaconBuildingListFilter)
     search_fields = ('from_beacon__location_name', 'to_beacon__location_name')
     ordering = ('from_beacon', 'priority')
     readonly_fields = ('id',)
@@ -378,11 +588,13 @@ class BeaconProximityAdmin(admin.ModelAdmin):
 
 
 @admin.register(IncidentSignal)
-class IncidentSignalAdmin(admin.ModelAdmin):
+class IncidentSignalAdmin(FKDropdownMixin, admin.ModelAdmin):
     list_display = ('id', 'incident', 'signal_type', 'source_user', 'source_device', 'get_description', 'created_at')
-    list_filter = ('signal_type', 'created_at', 'incident__beacon__building')
-    search_fields = ('incident__id', 'source_user__full_name', 'source_device__device_id', 'details__description')
+    list_select_related = ('incident__beacon', 'source_user', 'source_device__beacon')
+    list_filter = ('signal_type', 'created_at', IncidentBuildingListFilter)
+    search_fields = ('incident__id', 'source_user__full_name', 'source_device__device_id', 'description_text')
     ordering = ('-created_at',)
+    autocomplete_fields = ('incident', 'source_user', 'source_device', 'ai_event')
     readonly_fields = ('id', 'created_at', 'updated_at')
     fieldsets = (
         ('Incident', {'fields': ('incident',)}),
@@ -391,9 +603,16 @@ class IncidentSignalAdmin(admin.ModelAdmin):
         ('Timestamps', {'fields': ('id', 'created_at', 'updated_at')}),
     )
     
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if _is_changelist(request):
+            # The list only shows the description, read from description_text
+            queryset = queryset.defer('details')
+        return queryset
+    
     def get_description(self, obj):
-        """Extract description from details JSON for list view."""
-        description = obj.details.get('description', '')
+        """Show the description extracted from details for list view."""
+        description = obj.description_text or ''
         if description:
             return description[:50] + '...' if len(description) > 50 else description
         return '—'
@@ -401,12 +620,14 @@ class IncidentSignalAdmin(admin.ModelAdmin):
 
 
 @admin.register(IncidentImage)
-class IncidentImageAdmin(admin.ModelAdmin):
+class IncidentImageAdmin(FKDropdownMixin, admin.ModelAdmin):
     list_display = ('id', 'incident_link', 'get_incident_priority', 'uploaded_by', 'image_source', 'uploaded_at', 'image_preview')
-    list_filter = ('uploaded_at', 'incident__beacon__building', 'incident__priority')
+    list_select_related = ('incident', 'uploaded_by')
+    list_filter = ('uploaded_at', IncidentBuildingListFilter, 'incident__priority')
     search_fields = ('incident__id', 'uploaded_by__full_name', 'description')
     ordering = ('-uploaded_at',)
-    readonly_fields = ('id', 'uploaded_at', 'uploaded_by', 'image_preview', 'image_url_display', 'file_info')
+    autocomplete_fields = ('incident',)
+    readonly_fields = ('id', 'uploaded_at', 'uploaded_by', 'image_preview', 'image_url_display', 'file_info', 'image_source')
     fieldsets = (
         ('Image Info', {'fields': ('incident', 'image', 'image_preview')}),
         ('Image URL', {'fields': ('image_url_display',)}),
@@ -419,9 +640,9 @@ class IncidentImageAdmin(admin.ModelAdmin):
         if obj.image:
             # Ensure we have a proper file stored
             try:
-                image_url = obj.image.url
+                image_url = obj.preview_url
                 return format_html(
-                    '<img src="{}" width="400" height="300" style="max-width: 100%; height: auto; border-radius: 5px; border: 2px solid #007bff;" alt="Incident image" />',
+                    '<img src="{}" width="400" height="300" loading="lazy" decoding="async" style="max-width: 100%; height: auto; border-radius: 5px; border: 2px solid #007bff;" alt="Incident image" />',
                     image_url
                 )
             except Exception as e:
@@ -454,7 +675,8 @@ class IncidentImageAdmin(admin.ModelAdmin):
         """Display file information."""
         if obj.image:
             try:
-                file_size = obj.image.size
+                # Older rows have no stored size; fall back to asking the storage
+                file_size = obj.file_size if obj.file_size is not None else obj.image.size
                 file_name = obj.image.name
                 storage = obj.image.storage.__class__.__name__
                 
@@ -485,28 +707,18 @@ class IncidentImageAdmin(admin.ModelAdmin):
     
     def incident_link(self, obj):
         """Display clickable link to incident."""
-        incident_url = f'/admin/incidents/incident/{obj.incident.id}/change/'
+        # incident_id is on the row itself, so the link needs no join
+        incident_url = f'/admin/incidents/incident/{obj.incident_id}/change/'
         return format_html(
             '<a href="{}" style="color: #007bff; text-decoration: none; font-weight: bold;">🔗 {}</a>',
             incident_url,
-            str(obj.incident.id)[:8]
+            str(obj.incident_id)[:8]
         )
     incident_link.short_description = 'Incident'
     
     def get_incident_priority(self, obj):
         """Display incident priority with color."""
-        priority_colors = {
-            1: '#ffc107',  # LOW - yellow
-            2: '#17a2b8',  # MEDIUM - blue
-            3: '#fd7e14',  # HIGH - orange
-            4: '#dc3545',  # CRITICAL - red
-        }
-        color = priority_colors.get(obj.incident.priority, '#999')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 5px 10px; border-radius: 4px; font-weight: bold;">{}</span>',
-            color,
-            obj.incident.get_priority_display()
-        )
+        return _priority_badge(obj.incident.priority)
     get_incident_priority.short_description = '⚠️ Priority'
     
     def image_source(self, obj):
@@ -524,17 +736,19 @@ class IncidentImageAdmin(admin.ModelAdmin):
 
 
 @admin.register(IncidentEvent)
-class IncidentEventAdmin(admin.ModelAdmin):
+class IncidentEventAdmin(FKDropdownMixin, admin.ModelAdmin):
     """Admin interface for incident audit trail events."""
     list_display = ('id', 'incident', 'event_type', 'actor', 'target_guard', 'created_at')
+    list_select_related = ('incident__beacon', 'actor', 'target_guard')
     list_filter = ('event_type', 'created_at')
     search_fields = ('incident__id', 'actor__full_name', 'target_guard__full_name')
     ordering = ('-created_at',)
+    autocomplete_fields = ('incident', 'actor', 'target_guard')
     readonly_fields = ('id', 'created_at')
     fieldsets = (
         ('Event Info', {'fields': ('incident', 'event_type')}),
         ('Participants', {'fields': ('actor', 'target_guard')}),
-        ('State Changes', {'fields': ('previous_status', 'new_status', 'previous_priority', 'new_priority')}),
+        ('State Changes', {'fields': ('previous_status_code', 'new_status_code', 'previous_priority', 'new_priority')}),
         ('Details', {'fields': ('details',)}),
         ('Timestamps', {'fields': ('id', 'created_at')}),
     )
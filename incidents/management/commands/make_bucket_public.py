@@ -0,0 +1,39 @@
+"""Django management command to make the GCS media bucket publicly readable as a whole."""
+
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from google.cloud import storage
+from google.oauth2 import service_account
+
+
+class Command(BaseCommand):
+    help = (
+        'Enable uniform bucket-level access on the media bucket and grant public read, '
+        'so uploads no longer need a per-object make_public() call'
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Making the media bucket public...'))
+        
+        try:
+            # Initialize GCS client with service account credentials
+            credentials = service_account.Credentials.from_service_account_file(
+                'gen-lang-client-0117249847-4c0fea8c17a6.json'
+            )
+            client = storage.Client(credentials=credentials, project='gen-lang-client-0117249847')
+            bucket = client.get_bucket(settings.GS_BUCKET_NAME)
+            
+            bucket.iam_configuration.uniform_bucket_level_access_enabled = True
+            bucket.patch()
+            
+            policy = bucket.get_iam_policy(requested_policy_version=3)
+            binding = {'role': 'roles/storage.objectViewer', 'members': {'allUsers'}}
+            if binding not in policy.bindings:
+                policy.bindings.append(binding)
+                bucket.set_iam_policy(policy)
+            
+            self.stdout.write(self.style.SUCCESS(f'\n✅ gs://{bucket.name} is now publicly readable!'))
+            self.stdout.write(self.style.SUCCESS('Set GCS_BUCKET_PUBLIC_READ=True to stop per-image make_public() calls.'))
+            
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'❌ Error: {e}'))
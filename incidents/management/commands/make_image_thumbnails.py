@@ -0,0 +1,23 @@
+"""Django management command to build admin preview thumbnails for existing incident images."""
+
+from django.core.management.base import BaseCommand
+from incidents.models import IncidentImage
+
+
+class Command(BaseCommand):
+    help = 'Create preview thumbnails for incident images uploaded before thumbnails existed'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('Creating incident image thumbnails...'))
+        
+        images = IncidentImage.objects.filter(thumbnail='').exclude(image='')
+        count = 0
+        
+        for image in images.iterator():
+            if image.create_thumbnail():
+                count += 1
+                self.stdout.write(f"  ✅ {image.image.name}")
+            else:
+                self.stdout.write(self.style.WARNING(f"  ⚠️  {image.image.name}: see log for details"))
+        
+        self.stdout.write(self.style.SUCCESS(f'\n✅ Created {count} thumbnails!'))
@@ -1,5 +1,8 @@
 """Django management command to make all incident images publicly readable in GCS."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from incidents.models import IncidentImage
@@ -7,9 +10,20 @@ from google.cloud import storage
 from google.oauth2 import service_account
 
 
+CHUNK_SIZE = 500
+
+
 class Command(BaseCommand):
     help = 'Make all incident images publicly readable in Google Cloud Storage'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=16,
+            help='Number of concurrent make_public() requests (default: 16)',
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Making incident images public...'))
         
@@ -21,19 +35,30 @@ class Command(BaseCommand):
             client = storage.Client(credentials=credentials, project='gen-lang-client-0117249847')
             bucket = client.bucket(settings.GS_BUCKET_NAME)
             
-            # Get all incident images
-            images = IncidentImage.objects.all()
+            # Stream only the file names; memory stays flat however many images exist
+            names = (
+                IncidentImage.objects.exclude(image='')
+                .values_list('image', flat=True)
+                .iterator(chunk_size=CHUNK_SIZE)
+            )
             count = 0
             
-            for image in images:
-                if image.image.name:
-                    try:
-                        blob = bucket.blob(image.image.name)
-                        blob.make_public()
-                        count += 1
-                        self.stdout.write(f"  ✅ {image.image.name}")
-                    except Exception as e:
-                        self.stdout.write(self.style.WARNING(f"  ⚠️  {image.image.name}: {e}"))
+            # Each make_public() is a blocking ACL request; run them side by side,
+            # one chunk at a time so pending futures stay bounded too
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                while chunk := list(islice(names, CHUNK_SIZE)):
+                    futures = {
+                        executor.submit(bucket.blob(name).make_public): name
+                        for name in chunk
+                    }
+                    for future in as_completed(futures):
+                        name = futures[future]
+                        try:
+                            future.result()
+                            count += 1
+                            self.stdout.write(f"  ✅ {name}")
+                        except Exception as e:
+                            self.stdout.write(self.style.WARNING(f"  ⚠️  {name}: {e}"))
             
             self.stdout.write(self.style.SUCCESS(f'\n✅ Made {count} images publicly readable!'))
             self.stdout.write(self.style.SUCCESS('Images should now display in admin panel and transfer to guard app!'))
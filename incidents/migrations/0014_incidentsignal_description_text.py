@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:05
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0013_incident_buzzer_last_updated_incident_buzzer_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentsignal',
+            name='description_text',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.fields.json.KeyTextTransform('description', 'details'), help_text="details['description'] as a stored column, for search without JSON parsing", output_field=models.TextField(blank=True, null=True)),
+        ),
+    ]
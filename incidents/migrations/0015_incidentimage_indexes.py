@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0014_incidentsignal_description_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incidentimage',
+            index=models.Index(fields=['-uploaded_at'], name='incidents_i_uploade_9ec437_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentimage',
+            index=models.Index(fields=['incident', '-uploaded_at'], name='incidents_i_inciden_95daeb_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0015_incidentimage_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, help_text='Downscaled JPEG copy used for admin previews', upload_to='incidents/thumbs/%Y/%m/%d/'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Trigram indexes for admin search_fields (PostgreSQL only)
+
+from django.db import migrations
+
+
+# (index name, table, column) for columns searched with icontains in the admin
+TRIGRAM_INDEXES = [
+    ('incidents_beacon_loc_trgm', 'incidents_beacon', 'location_name'),
+    ('incidents_beacon_bldg_trgm', 'incidents_beacon', 'building'),
+    ('incidents_incident_desc_trgm', 'incidents_incident', 'description'),
+    ('incidents_incident_loc_trgm', 'incidents_incident', 'location'),
+    ('incidents_device_id_trgm', 'incidents_physicaldevice', 'device_id'),
+    ('incidents_device_name_trgm', 'incidents_physicaldevice', 'name'),
+    ('incidents_signal_desc_trgm', 'incidents_incidentsignal', 'description_text'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """ILIKE '%term%' can't use a b-tree; pg_trgm GIN indexes can serve it."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0016_incidentimage_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
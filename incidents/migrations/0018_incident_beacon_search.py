@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:13
+
+from django.db import migrations, models
+
+
+def backfill_beacon_search(apps, schema_editor):
+    Beacon = apps.get_model('incidents', 'Beacon')
+    Incident = apps.get_model('incidents', 'Incident')
+    for beacon in Beacon.objects.only('id', 'beacon_id', 'location_name').iterator():
+        text = f"{beacon.beacon_id or ''} {beacon.location_name}".strip()[:255]
+        Incident.objects.filter(beacon_id=beacon.pk).update(beacon_search=text)
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS incidents_incident_bsearch_trgm '
+        'ON incidents_incident USING gin (beacon_search gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS incidents_incident_bsearch_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0017_admin_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='beacon_search',
+            field=models.CharField(blank=True, editable=False, help_text='Denormalized beacon id + location name for admin search', max_length=255),
+        ),
+        migrations.RunPython(backfill_beacon_search, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
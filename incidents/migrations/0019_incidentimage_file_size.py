@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0018_incident_beacon_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentimage',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, help_text='Size of the original image in bytes, recorded at upload', null=True),
+        ),
+    ]
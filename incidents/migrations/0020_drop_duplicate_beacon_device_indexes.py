@@ -0,0 +1,47 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0019_incidentimage_file_size'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='beacon',
+            name='incidents_b_beacon__3269bd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='beacon',
+            name='incidents_b_is_acti_6ca5cd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='physicaldevice',
+            name='incidents_p_device__5ffe9b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='physicaldevice',
+            name='incidents_p_device__8a9b14_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='physicaldevice',
+            name='incidents_p_beacon__c5262f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='physicaldevice',
+            name='incidents_p_is_acti_0c8c0a_idx',
+        ),
+        migrations.AlterField(
+            model_name='beacon',
+            name='beacon_id',
+            field=models.CharField(blank=True, help_text='Hardware beacon ID (UUID:major:minor)', max_length=100, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='physicaldevice',
+            name='device_id',
+            field=models.CharField(help_text='Device identifier (e.g., ESP32-001, AI-VISION-01)', max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0020_drop_duplicate_beacon_device_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['status', '-priority', '-created_at'], name='incident_dispatch_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='incident',
+            name='incidents_i_status_3b7181_idx',
+        ),
+    ]
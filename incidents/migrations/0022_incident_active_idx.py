@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0021_incident_dispatch_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(condition=models.Q(('status__in', ['CREATED', 'ASSIGNED', 'IN_PROGRESS'])), fields=['-created_at'], name='incident_active_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:44
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0022_incident_active_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='beaconproximity',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='incident',
+            options={'verbose_name': 'Incident', 'verbose_name_plural': 'Incidents'},
+        ),
+        migrations.AlterModelOptions(
+            name='incidentevent',
+            options={'verbose_name': 'Incident Event', 'verbose_name_plural': 'Incident Events'},
+        ),
+        migrations.AlterModelOptions(
+            name='incidentimage',
+            options={'verbose_name': 'Incident Image', 'verbose_name_plural': 'Incident Images'},
+        ),
+        migrations.AlterModelOptions(
+            name='incidentsignal',
+            options={},
+        ),
+    ]
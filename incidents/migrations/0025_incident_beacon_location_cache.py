@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:52
+
+from django.db import migrations, models
+
+
+def backfill_beacon_location_cache(apps, schema_editor):
+    Beacon = apps.get_model('incidents', 'Beacon')
+    Incident = apps.get_model('incidents', 'Incident')
+    for beacon in Beacon.objects.only('id', 'location_name').iterator():
+        Incident.objects.filter(beacon_id=beacon.pk).update(
+            beacon_location_cache=beacon.location_name
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0023_remove_default_orderings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='beacon_location_cache',
+            field=models.CharField(blank=True, editable=False, help_text='Denormalized beacon location name for display', max_length=255),
+        ),
+        migrations.RunPython(backfill_beacon_location_cache, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-16 21:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0025_incident_beacon_location_cache'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['current_assigned_guard', 'status', '-created_at'], name='incident_guard_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(condition=models.Q(('resolved_at__isnull', False)), fields=['resolved_by', '-resolved_at'], name='incident_resolver_idx'),
+        ),
+    ]
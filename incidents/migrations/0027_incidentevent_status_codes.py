@@ -0,0 +1,49 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:10
+
+from django.db import migrations, models
+
+
+STATUS_CODES = {'CREATED': 1, 'ASSIGNED': 2, 'IN_PROGRESS': 3, 'RESOLVED': 4}
+
+
+def status_to_code(apps, schema_editor):
+    IncidentEvent = apps.get_model('incidents', 'IncidentEvent')
+    for status, code in STATUS_CODES.items():
+        IncidentEvent.objects.filter(previous_status=status).update(previous_status_code=code)
+        IncidentEvent.objects.filter(new_status=status).update(new_status_code=code)
+
+
+def code_to_status(apps, schema_editor):
+    IncidentEvent = apps.get_model('incidents', 'IncidentEvent')
+    for status, code in STATUS_CODES.items():
+        IncidentEvent.objects.filter(previous_status_code=code).update(previous_status=status)
+        IncidentEvent.objects.filter(new_status_code=code).update(new_status=status)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0026_incident_guard_resolver_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentevent',
+            name='previous_status_code',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Created'), (2, 'Assigned to Guard'), (3, 'In Progress'), (4, 'Resolved')], null=True),
+        ),
+        migrations.AddField(
+            model_name='incidentevent',
+            name='new_status_code',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Created'), (2, 'Assigned to Guard'), (3, 'In Progress'), (4, 'Resolved')], null=True),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        migrations.RemoveField(
+            model_name='incidentevent',
+            name='previous_status',
+        ),
+        migrations.RemoveField(
+            model_name='incidentevent',
+            name='new_status',
+        ),
+    ]
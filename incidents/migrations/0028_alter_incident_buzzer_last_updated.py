@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0027_incidentevent_status_codes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='incident',
+            name='buzzer_last_updated',
+            field=models.DateTimeField(blank=True, help_text='Last time buzzer status was changed', null=True),
+        ),
+    ]
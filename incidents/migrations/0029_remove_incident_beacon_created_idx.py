@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0028_alter_incident_buzzer_last_updated'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='incident',
+            name='incidents_i_created_c4c91a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='incident',
+            name='incidents_i_beacon__8ad29b_idx',
+        ),
+    ]
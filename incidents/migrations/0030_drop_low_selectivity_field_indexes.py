@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0029_remove_incident_beacon_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='beacon',
+            name='is_active',
+            field=models.BooleanField(default=True, help_text='Is beacon operational'),
+        ),
+        migrations.AlterField(
+            model_name='incident',
+            name='status',
+            field=models.CharField(choices=[('CREATED', 'Created'), ('ASSIGNED', 'Assigned to Guard'), ('IN_PROGRESS', 'In Progress'), ('RESOLVED', 'Resolved')], default='CREATED', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='physicaldevice',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+    ]
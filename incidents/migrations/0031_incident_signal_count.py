@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-16 22:55
+
+from django.db import migrations, models
+
+
+def backfill_signal_count(apps, schema_editor):
+    Incident = apps.get_model('incidents', 'Incident')
+    IncidentSignal = apps.get_model('incidents', 'IncidentSignal')
+    counts = IncidentSignal.objects.values('incident_id').annotate(count=models.Count('id')).order_by()
+    for row in counts.iterator():
+        Incident.objects.filter(pk=row['incident_id']).update(signal_count=row['count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0030_drop_low_selectivity_field_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='signal_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of signals'),
+        ),
+        migrations.RunPython(backfill_signal_count, migrations.RunPython.noop),
+    ]
@@ -1,13 +1,22 @@
+import logging
+import os
 import uuid
+from io import BytesIO
+from django.core.files.base import ContentFile
 from django.db import models
+from django.db.models.fields.json import KT
 from django.conf import settings
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
 
 
 class Beacon(models.Model):
     """Physical beacon for indoor location tracking (iBeacon/Eddystone)."""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    beacon_id = models.CharField(max_length=100, unique=True, db_index=True, null=True, blank=True, help_text="Hardware beacon ID (UUID:major:minor)")
+    beacon_id = models.CharField(max_length=100, unique=True, null=True, blank=True, help_text="Hardware beacon ID (UUID:major:minor)")
     uuid = models.CharField(max_length=36, db_index=True, help_text="iBeacon UUID")
     major = models.IntegerField(help_text="iBeacon major value")
     minor = models.IntegerField(help_text="iBeacon minor value")
@@ -28,17 +37,17 @@ class Beacon(models.Model):
         help_text="Nearby beacons in priority order for guard search expansion"
     )
     
-    is_active = models.BooleanField(default=True, db_index=True, help_text="Is beacon operational")
+    is_active = models.BooleanField(default=True, help_text="Is beacon operational")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["building", "floor", "location_name"]
+        # beacon_id (unique) is indexed by its field definition; is_active is
+        # only ever checked alongside it, so it has no index of its own
         indexes = [
-            models.Index(fields=["beacon_id"]),
             models.Index(fields=["uuid", "major", "minor"]),
             models.Index(fields=["building", "floor"]),
-            models.Index(fields=["is_active"]),
         ]
         constraints = [
             models.UniqueConstraint(fields=["major", "minor"], name="unique_beacon_major_minor")
@@ -71,7 +80,6 @@ class BeaconProximity(models.Model):
     )
     
     class Meta:
-        ordering = ['priority']
         constraints = [
             models.UniqueConstraint(
                 fields=['from_beacon', 'to_beacon'],
@@ -86,6 +94,76 @@ class BeaconProximity(models.Model):
         return f"{self.from_beacon.location_name} → {self.to_beacon.location_name} (Priority {self.priority})"
 
 
+class IncidentQuerySet(models.QuerySet):
+    def with_relations(self):
+        """
+        Join and prefetch everything the incident serializers read.
+        
+        FKs are joined; reverse relations are prefetched in display order,
+        so each page of incidents costs a fixed number of queries.
+        """
+        from security.models import GuardAlert
+        return self.select_related(
+            'beacon', 'resolved_by', 'current_assigned_guard', 'conversation'
+        ).prefetch_related(
+            models.Prefetch(
+                'images',
+                queryset=IncidentImage.objects.select_related('uploaded_by').order_by('uploaded_at'),
+            ),
+            models.Prefetch(
+                'signals',
+                queryset=IncidentSignal.objects.select_related(
+                    'source_user', 'source_device__beacon'
+                ).order_by('-created_at'),
+            ),
+            models.Prefetch(
+                'events',
+                queryset=IncidentEvent.objects.select_related('actor', 'target_guard').order_by('-created_at'),
+            ),
+            self._active_assignments_prefetch(),
+            models.Prefetch(
+                'guard_alerts',
+                queryset=GuardAlert.objects.select_related('guard').order_by('priority_rank'),
+                to_attr='ordered_alerts',
+            ),
+            'conversation__messages__sender',
+        )
+    
+    def for_list(self):
+        """
+        Only the columns the incident list reads.
+        
+        The beacon is joined whole for BeaconSerializer; the image count
+        comes from an annotation in the same query.
+        """
+        return self.select_related('beacon').only(
+            'id', 'beacon', 'status', 'priority', 'description', 'report_type', 'location',
+            'beacon_location_cache', 'first_signal_time', 'last_signal_time', 'created_at',
+            'signal_count',
+        ).annotate(
+            _image_count=models.Count('images', distinct=True),
+        ).prefetch_related(self._active_assignments_prefetch(
+            'id', 'incident', 'guard', 'assigned_at', 'guard__id', 'guard__full_name',
+        ))
+    
+    @staticmethod
+    def _active_assignments_prefetch(*fields):
+        """
+        Active guard assignments (with guard) as obj.active_guard_assignments.
+        
+        Pass fields to load only those columns of the assignment and guard.
+        """
+        from security.models import GuardAssignment
+        queryset = GuardAssignment.objects.filter(is_active=True).select_related('guard')
+        if fields:
+            queryset = queryset.only(*fields)
+        return models.Prefetch(
+            'guard_assignments',
+            queryset=queryset,
+            to_attr='active_guard_assignments',
+        )
+
+
 class Incident(models.Model):
     """Unified incident model - beacon-centric emergency."""
     
@@ -119,11 +197,11 @@ class Incident(models.Model):
         related_name="incidents",
         help_text="Location of emergency (mandatory)"
     )
+    # Status lookups use incident_dispatch_idx / incident_active_idx
     status = models.CharField(
         max_length=20,
         choices=Status.choices,
-        default=Status.CREATED,
-        db_index=True
+        default=Status.CREATED
     )
     priority = models.IntegerField(
         choices=Priority.choices,
@@ -141,6 +219,18 @@ class Incident(models.Model):
         blank=True,
         help_text="Location description if different from beacon"
     )
+    beacon_search = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Denormalized beacon id + location name for admin search"
+    )
+    beacon_location_cache = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Denormalized beacon location name for display"
+    )
     first_signal_time = models.DateTimeField(null=True, blank=True, db_index=True)
     last_signal_time = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -184,27 +274,77 @@ class Incident(models.Model):
         help_text="Current buzzer status for ESP32 devices at this beacon"
     )
     buzzer_last_updated = models.DateTimeField(
-        auto_now=True,
+        null=True,
+        blank=True,
         help_text="Last time buzzer status was changed"
     )
     
-    # Alert stats
+    # Alert stats - increment with a single UPDATE, e.g.
+    # Incident.objects.filter(pk=pk).update(total_alerts_sent=F('total_alerts_sent') + 1),
+    # never with a read-modify-write save()
     total_alerts_sent = models.PositiveIntegerField(default=0, help_text="Total alerts sent to guards")
     total_alerts_declined = models.PositiveIntegerField(default=0, help_text="Total alerts declined by guards")
+    # Kept in step by the IncidentSignal receivers in incidents/signals.py
+    signal_count = models.PositiveIntegerField(default=0, editable=False, help_text="Number of signals")
+    
+    objects = IncidentQuerySet.as_manager()
     
     class Meta:
-        ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["-created_at"]),
-            models.Index(fields=["status", "-created_at"]),
-            models.Index(fields=["beacon", "-created_at"]),
+            models.Index(fields=["status", "-priority", "-created_at"], name="incident_dispatch_idx"),
+            models.Index(
+                fields=["-created_at"],
+                name="incident_active_idx",
+                condition=models.Q(status__in=["CREATED", "ASSIGNED", "IN_PROGRESS"]),
+            ),
             models.Index(fields=["beacon", "status", "-created_at"]),
+            models.Index(fields=["current_assigned_guard", "status", "-created_at"], name="incident_guard_status_idx"),
+            models.Index(
+                fields=["resolved_by", "-resolved_at"],
+                name="incident_resolver_idx",
+                condition=models.Q(resolved_at__isnull=False),
+            ),
         ]
         verbose_name = "Incident"
         verbose_name_plural = "Incidents"
     
     def __str__(self):
-        return f"Incident {str(self.id)[:8]} at {self.beacon.location_name} - {self.get_status_display()}"
+        return f"Incident {str(self.id)[:8]} at {self.beacon_location_cache} - {self.get_status_display()}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Snapshot for save(); skipped when the column was deferred
+        instance._saved_buzzer_status = instance.__dict__.get('buzzer_status')
+        return instance
+
+    @staticmethod
+    def build_beacon_search(beacon):
+        """Text stored in beacon_search for the given beacon."""
+        return f"{beacon.beacon_id or ''} {beacon.location_name}".strip()[:255]
+
+    def save(self, *args, **kwargs):
+        # Only touch the beacon-derived columns when the beacon itself may have
+        # changed, so partial saves (update_fields) don't pay for a beacon lookup.
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'beacon' in update_fields or 'beacon_id' in update_fields:
+            self.beacon_search = self.build_beacon_search(self.beacon)
+            self.beacon_location_cache = self.beacon.location_name
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'beacon_search', 'beacon_location_cache'}
+        # Stamp buzzer_last_updated only when buzzer_status actually changes
+        buzzer_status = self.__dict__.get('buzzer_status')
+        if (
+            buzzer_status is not None
+            and (update_fields is None or 'buzzer_status' in update_fields)
+            and buzzer_status != getattr(self, '_saved_buzzer_status', None)
+        ):
+            self.buzzer_last_updated = timezone.now()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'buzzer_last_updated'}
+        super().save(*args, **kwargs)
+        if update_fields is None or 'buzzer_status' in update_fields:
+            self._saved_buzzer_status = buzzer_status
 
 
 class IncidentImage(models.Model):
@@ -229,6 +369,18 @@ class IncidentImage(models.Model):
         related_name="incident_images",
         help_text="User who uploaded image"
     )
+    thumbnail = models.ImageField(
+        upload_to='incidents/thumbs/%Y/%m/%d/',
+        blank=True,
+        editable=False,
+        help_text="Downscaled JPEG copy used for admin previews"
+    )
+    file_size = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Size of the original image in bytes, recorded at upload"
+    )
     uploaded_at = models.DateTimeField(auto_now_add=True)
     description = models.CharField(
         max_length=255,
@@ -237,45 +389,74 @@ class IncidentImage(models.Model):
     )
     
     class Meta:
-        ordering = ['uploaded_at']
+        indexes = [
+            models.Index(fields=["-uploaded_at"]),
+            models.Index(fields=["incident", "-uploaded_at"]),
+        ]
         verbose_name = "Incident Image"
         verbose_name_plural = "Incident Images"
     
+    # Bounding box for admin previews (the largest preview is 400x300)
+    THUMBNAIL_SIZE = (400, 300)
+    
     def save(self, *args, **kwargs):
-        """Save image and make it publicly readable on GCS."""
-        import logging
-        logger = logging.getLogger(__name__)
+        """Save image, then queue making it public on GCS and building its thumbnail."""
+        # Record the size while the upload is still local, so the admin
+        # doesn't have to ask the storage backend for it later
+        if self.image and self.file_size is None:
+            try:
+                self.file_size = self.image.size
+            except Exception as e:
+                logger.warning(f"Could not read size of image {self.image.name}: {e}")
         
         # Save model to database AND upload file to storage
         super().save(*args, **kwargs)
         
         # After save, try to make the file public (only for GCS)
         if self.image:
-            try:
-                # Check if using GCS backend
-                storage_backend = self.image.storage
-                if hasattr(storage_backend, 'bucket'):
-                    bucket = storage_backend.bucket
-                    blob_name = self.image.name
-                    blob = bucket.blob(blob_name)
-                    
-                    # Try to make public
-                    if blob.exists():
-                        blob.make_public()
-                        logger.info(f"✓ Image {self.id} made public: gs://{bucket.name}/{blob_name}")
-                    else:
-                        logger.warning(f"⚠ Image {self.id} blob not found immediately after save: {blob_name}")
-                        # Try again with a short delay in case of eventual consistency
-                        import time
-                        time.sleep(0.5)
-                        if blob.exists():
-                            blob.make_public()
-                            logger.info(f"✓ Image {self.id} made public (after retry): gs://{bucket.name}/{blob_name}")
-                else:
-                    logger.debug(f"Image {self.id} not using GCS backend (local storage)")
-            except Exception as e:
-                # Log but don't fail - image already saved to storage
-                logger.error(f"✗ Could not make image {self.id} public: {type(e).__name__}: {e}")
+            self._make_public(self.image)
+            if not self.thumbnail:
+                # Off the request: the admin shows the original until it exists
+                from .tasks import create_thumbnail_on_commit
+                create_thumbnail_on_commit(self)
+    
+    def _make_public(self, field_file):
+        """Make a stored file publicly readable in the background when the storage is GCS."""
+        from .tasks import make_public_on_commit
+        make_public_on_commit(field_file, f"Image {self.id}")
+    
+    @property
+    def preview_url(self):
+        """URL of the preview thumbnail, or of the original if there is none yet."""
+        if self.thumbnail:
+            return self.thumbnail.url
+        return self.image.url
+    
+    def create_thumbnail(self):
+        """
+        Store a downscaled JPEG of the image in ``thumbnail``.
+        
+        Returns True on success. Failures are logged and leave the admin
+        falling back to the original image.
+        """
+        try:
+            from PIL import Image, ImageOps
+            
+            with self.image.open('rb') as source:
+                picture = ImageOps.exif_transpose(Image.open(source))
+                picture.thumbnail(self.THUMBNAIL_SIZE)
+                buffer = BytesIO()
+                picture.convert('RGB').save(buffer, format='JPEG', quality=80)
+            
+            name = os.path.splitext(os.path.basename(self.image.name))[0] + '.jpg'
+            self.thumbnail.save(name, ContentFile(buffer.getvalue()), save=False)
+            # Plain UPDATE so save() (and its GCS calls) doesn't run again
+            type(self).objects.filter(pk=self.pk).update(thumbnail=self.thumbnail.name)
+            self._make_public(self.thumbnail)
+            return True
+        except Exception as e:
+            logger.error(f"✗ Could not create thumbnail for image {self.id}: {type(e).__name__}: {e}")
+            return False
     
     def __str__(self):
         uploader = self.uploaded_by.email if self.uploaded_by else "Unknown"
@@ -328,18 +509,30 @@ class IncidentSignal(models.Model):
         help_text="AI event that triggered signal"
     )
     details = models.JSONField(default=dict, blank=True)
+    description_text = models.GeneratedField(
+        expression=KT("details__description"),
+        output_field=models.TextField(null=True, blank=True),
+        db_persist=True,
+        help_text="details['description'] as a stored column, for search without JSON parsing"
+    )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["incident", "-created_at"]),
             models.Index(fields=["signal_type", "-created_at"]),
         ]
     
     def __str__(self):
-        return f"Signal {self.id} ({self.get_signal_type_display()}) → Incident {str(self.incident.id)[:8]}"
+        return f"Signal {self.id} ({self.get_signal_type_display()}) → Incident {str(self.incident_id)[:8]}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Snapshot for the signal_count receivers; skipped when deferred
+        instance._saved_incident_id = instance.__dict__.get('incident_id')
+        return instance
 
 
 class PhysicalDevice(models.Model):
@@ -351,7 +544,7 @@ class PhysicalDevice(models.Model):
         AI_AUDIO = "AI_AUDIO", "AI Audio Detection"
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    device_id = models.CharField(max_length=100, unique=True, db_index=True, help_text="Device identifier (e.g., ESP32-001, AI-VISION-01)")
+    device_id = models.CharField(max_length=100, unique=True, help_text="Device identifier (e.g., ESP32-001, AI-VISION-01)")
     device_type = models.CharField(
         max_length=50,
         choices=DeviceType.choices,
@@ -366,18 +559,14 @@ class PhysicalDevice(models.Model):
         help_text="Location where this device is situated"
     )
     name = models.CharField(max_length=255, blank=True, help_text="Device location name (e.g., Library Entrance)")
-    is_active = models.BooleanField(default=True, db_index=True)
+    is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ["device_id"]
-        indexes = [
-            models.Index(fields=["device_id"]),
-            models.Index(fields=["device_type"]),
-            models.Index(fields=["beacon"]),
-            models.Index(fields=["is_active"]),
-        ]
+        # device_id (unique), device_type and beacon (FK) are already indexed
+        # by their field definitions; is_active is only checked with device_id
     
     def __str__(self):
         return f"{self.device_id} ({self.get_device_type_display()}) - {self.beacon.location_name}"
@@ -417,6 +606,13 @@ class IncidentEvent(models.Model):
         ESCALATED_NO_RESPONSE = "ESCALATED_NO_RESPONSE", "Escalated - No Response"
         ALL_GUARDS_EXHAUSTED = "ALL_GUARDS_EXHAUSTED", "All Guards Exhausted"
     
+    class StatusCode(models.IntegerChoices):
+        """Incident.Status stored as a small integer; member names match the status values."""
+        CREATED = 1, "Created"
+        ASSIGNED = 2, "Assigned to Guard"
+        IN_PROGRESS = 3, "In Progress"
+        RESOLVED = 4, "Resolved"
+    
     id = models.AutoField(primary_key=True)
     incident = models.ForeignKey(
         Incident,
@@ -449,9 +645,9 @@ class IncidentEvent(models.Model):
         help_text="Guard targeted by this event (for alerts)"
     )
     
-    # State transition tracking
-    previous_status = models.CharField(max_length=20, blank=True)
-    new_status = models.CharField(max_length=20, blank=True)
+    # State transition tracking (read the status strings via previous_status/new_status)
+    previous_status_code = models.PositiveSmallIntegerField(choices=StatusCode.choices, null=True, blank=True)
+    new_status_code = models.PositiveSmallIntegerField(choices=StatusCode.choices, null=True, blank=True)
     previous_priority = models.IntegerField(null=True, blank=True)
     new_priority = models.IntegerField(null=True, blank=True)
     
@@ -461,7 +657,6 @@ class IncidentEvent(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     
     class Meta:
-        ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["incident", "-created_at"]),
             models.Index(fields=["event_type", "-created_at"]),
@@ -471,6 +666,21 @@ class IncidentEvent(models.Model):
         verbose_name = "Incident Event"
         verbose_name_plural = "Incident Events"
     
+    @classmethod
+    def status_code(cls, status):
+        """StatusCode for an Incident.Status value, or None for no status."""
+        return cls.StatusCode[status] if status else None
+    
+    @property
+    def previous_status(self):
+        """Incident.Status value before the transition, or ''."""
+        return self.StatusCode(self.previous_status_code).name if self.previous_status_code else ''
+    
+    @property
+    def new_status(self):
+        """Incident.Status value after the transition, or ''."""
+        return self.StatusCode(self.new_status_code).name if self.new_status_code else ''
+    
     def __str__(self):
-        return f"[{self.get_event_type_display()}] Incident {str(self.incident.id)[:8]} at {self.created_at.strftime('%H:%M:%S')}"
+        return f"[{self.get_event_type_display()}] Incident {str(self.incident_id)[:8]} at {self.created_at.strftime('%H:%M:%S')}"
 
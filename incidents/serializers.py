@@ -2,6 +2,60 @@ from rest_framework import serializers
 from .models import Beacon, Incident, IncidentSignal, PhysicalDevice, IncidentImage, IncidentEvent
 from security.models import GuardAssignment, GuardAlert
 from chat.models import Conversation, Message
+from .signals import get_active_beacon_pk
+
+
+def ordered_related(obj, name, *ordering):
+    """Rows of a reverse relation in the given order, reusing a prefetch if present."""
+    if name in getattr(obj, '_prefetched_objects_cache', {}):
+        return getattr(obj, name).all()
+    return getattr(obj, name).order_by(*ordering)
+
+
+def requested_expansions(context):
+    """Names listed in the request's ?expand= parameter (comma separated)."""
+    request = context.get('request')
+    if request is None:
+        return set()
+    return {name.strip() for name in request.query_params.get('expand', '').split(',') if name.strip()}
+
+
+def ordered_guard_alerts(obj):
+    """The incident's GuardAlerts with their guards, by priority_rank."""
+    # Prefetched by Incident.objects.with_relations()
+    alerts = getattr(obj, 'ordered_alerts', None)
+    if alerts is None:
+        alerts = obj.ordered_alerts = list(
+            obj.guard_alerts.select_related('guard').order_by('priority_rank')
+        )
+    return alerts
+
+
+def active_guard_assignment(obj):
+    """The incident's active GuardAssignment with its guard, or None."""
+    # Prefetched by Incident.objects.with_relations() / for_list()
+    if hasattr(obj, 'active_guard_assignments'):
+        return obj.active_guard_assignments[0] if obj.active_guard_assignments else None
+    return obj.guard_assignments.filter(is_active=True).select_related('guard').first()
+
+
+class UserNameSerializer(serializers.Serializer):
+    """Id (as a string) and name of a related user."""
+
+    id = serializers.CharField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
+
+
+class UserMiniSerializer(UserNameSerializer):
+    """UserNameSerializer plus the user's email."""
+
+    email = serializers.EmailField(read_only=True)
+
+
+class UserContactSerializer(UserMiniSerializer):
+    """UserMiniSerializer plus the user's phone number."""
+
+    phone_number = serializers.CharField(read_only=True)
 
 
 class IncidentImageSerializer(serializers.ModelSerializer):
@@ -52,55 +106,47 @@ class BeaconSerializer(serializers.ModelSerializer):
 
 
 class PhysicalDeviceSerializer(serializers.ModelSerializer):
-    """Serializer for PhysicalDevice."""
+    """
+    Serializer for PhysicalDevice.
+    
+    The beacon is rendered as its id; ?expand=beacon nests the full beacon.
+    """
 
-    beacon = BeaconSerializer(read_only=True)
+    beacon = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
         model = PhysicalDevice
         fields = ('id', 'device_id', 'device_type', 'beacon', 'name', 'is_active')
         read_only_fields = ('id',)
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if 'beacon' in requested_expansions(self.context):
+            fields['beacon'] = BeaconSerializer(read_only=True)
+        return fields
+
 
 class IncidentSignalSerializer(serializers.ModelSerializer):
     """Serializer for IncidentSignal - individual triggers."""
 
-    source_user = serializers.SerializerMethodField()
+    source_user = UserContactSerializer(read_only=True)
     source_device = PhysicalDeviceSerializer(read_only=True)
     
     class Meta:
         model = IncidentSignal
         fields = ('id', 'signal_type', 'source_user', 'source_device', 'ai_event', 'details', 'created_at')
         read_only_fields = ('id', 'created_at')
-    
-    def get_source_user(self, obj):
-        if obj.source_user:
-            return {
-                'id': str(obj.source_user.id),
-                'full_name': obj.source_user.full_name,
-                'email': obj.source_user.email,
-                'phone_number': obj.source_user.phone_number
-            }
-        return None
 
 
 class MessageSerializer(serializers.ModelSerializer):
     """Serializer for Message."""
 
-    sender = serializers.SerializerMethodField()
+    sender = UserContactSerializer(read_only=True)
 
     class Meta:
         model = Message
         fields = ('id', 'sender', 'message_text', 'created_at')
         read_only_fields = ('id', 'sender', 'created_at')
-    
-    def get_sender(self, obj):
-        return {
-            'id': str(obj.sender.id),
-            'full_name': obj.sender.full_name,
-            'email': obj.sender.email,
-            'phone_number': obj.sender.phone_number
-        }
 
 
 class ConversationSerializer(serializers.ModelSerializer):
@@ -117,26 +163,30 @@ class ConversationSerializer(serializers.ModelSerializer):
 class GuardAssignmentSerializer(serializers.ModelSerializer):
     """Serializer for GuardAssignment."""
 
-    guard = serializers.SerializerMethodField()
+    guard = UserMiniSerializer(read_only=True)
 
     class Meta:
         model = GuardAssignment
         fields = ('id', 'guard', 'assigned_at', 'is_active')
         read_only_fields = ('id', 'assigned_at')
-    
-    def get_guard(self, obj):
-        return {
-            'id': str(obj.guard.id),
-            'full_name': obj.guard.full_name,
-            'email': obj.guard.email
-        }
+
+
+class GuardAlertMiniSerializer(serializers.ModelSerializer):
+    """Alert summary embedded in incident details."""
+
+    guard = UserNameSerializer(read_only=True)
+
+    class Meta:
+        model = GuardAlert
+        fields = ('id', 'guard', 'status', 'distance_km', 'priority_rank', 'alert_sent_at')
+        read_only_fields = fields
 
 
 class IncidentDetailedSerializer(serializers.ModelSerializer):
     """Full incident serializer with all related data."""
 
     beacon = BeaconSerializer(read_only=True)
-    signals = IncidentSignalSerializer(many=True, read_only=True)
+    signals = serializers.SerializerMethodField()
     images = serializers.SerializerMethodField()
     guard_assignment = serializers.SerializerMethodField()
     conversation = ConversationSerializer(read_only=True)
@@ -152,41 +202,30 @@ class IncidentDetailedSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'first_signal_time', 'last_signal_time')
     
+    def get_signals(self, obj):
+        signals = ordered_related(obj, 'signals', '-created_at')
+        return IncidentSignalSerializer(signals, many=True, context=self.context).data
+
     def get_images(self, obj):
         """Return images with absolute URLs by passing request context through."""
-        images = obj.images.all()
+        images = ordered_related(obj, 'images', 'uploaded_at')
         return IncidentImageSerializer(images, many=True, context=self.context).data
 
     def get_guard_assignment(self, obj):
-        try:
-            assignment = obj.guard_assignments.get(is_active=True)
-            return GuardAssignmentSerializer(assignment).data
-        except GuardAssignment.DoesNotExist:
+        assignment = active_guard_assignment(obj)
+        if assignment is None:
             return None
+        return GuardAssignmentSerializer(assignment).data
     
     def get_guard_alerts(self, obj):
-        alerts = obj.guard_alerts.all().order_by('priority_rank')
-        return [
-            {
-                'id': alert.id,
-                'guard': {
-                    'id': str(alert.guard.id),
-                    'full_name': alert.guard.full_name
-                },
-                'status': alert.status,
-                'distance_km': alert.distance_km,
-                'priority_rank': alert.priority_rank,
-                'alert_sent_at': alert.alert_sent_at
-            }
-            for alert in alerts
-        ]
+        return GuardAlertMiniSerializer(ordered_guard_alerts(obj), many=True).data
 
 
 class IncidentListSerializer(serializers.ModelSerializer):
     """Lightweight incident serializer for list views."""
 
     beacon = BeaconSerializer(read_only=True)
-    signal_count = serializers.SerializerMethodField()
+    signal_count = serializers.IntegerField(read_only=True)
     image_count = serializers.SerializerMethodField()
     guard_assignment = serializers.SerializerMethodField()
 
@@ -200,21 +239,20 @@ class IncidentListSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'first_signal_time', 'last_signal_time')
     
-    def get_signal_count(self, obj):
-        return obj.signals.count()
-    
     def get_image_count(self, obj):
+        # Annotated by Incident.objects.for_list()
+        if hasattr(obj, '_image_count'):
+            return obj._image_count
         return obj.images.count()
     
     def get_guard_assignment(self, obj):
-        try:
-            assignment = obj.guard_assignments.get(is_active=True)
-            return {
-                'guard_name': assignment.guard.full_name,
-                'assigned_at': assignment.assigned_at
-            }
-        except GuardAssignment.DoesNotExist:
+        assignment = active_guard_assignment(obj)
+        if assignment is None:
             return None
+        return {
+            'guard_name': assignment.guard.full_name,
+            'assigned_at': assignment.assigned_at
+        }
 
 
 class IncidentCreateSerializer(serializers.Serializer):
@@ -226,6 +264,15 @@ class IncidentCreateSerializer(serializers.Serializer):
     class Meta:
         fields = ('beacon_id', 'description')
 
+    def validate_beacon_id(self, value):
+        # Virtual location:* beacons are created on demand by the service
+        if value.startswith('location:'):
+            return value
+        # Warms the lookup cache that get_or_create_incident_with_signals() reads
+        if get_active_beacon_pk(value) is None:
+            raise serializers.ValidationError(f"Invalid or inactive beacon: {value}")
+        return value
+
 
 class IncidentStatusUpdateSerializer(serializers.ModelSerializer):
     """
@@ -240,7 +287,7 @@ class IncidentStatusUpdateSerializer(serializers.ModelSerializer):
     """
     
     beacon = BeaconSerializer(read_only=True)
-    signal_count = serializers.SerializerMethodField()
+    signal_count = serializers.IntegerField(read_only=True)
     guard_status = serializers.SerializerMethodField()
     guard_assignment = serializers.SerializerMethodField()
     alert_status_summary = serializers.SerializerMethodField()
@@ -260,10 +307,6 @@ class IncidentStatusUpdateSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'first_signal_time', 'last_signal_time')
     
-    def get_signal_count(self, obj):
-        """Count of signals for this incident."""
-        return obj.signals.count()
-    
     def get_guard_status(self, obj):
         """
         Return guard assignment status.
@@ -274,20 +317,19 @@ class IncidentStatusUpdateSerializer(serializers.ModelSerializer):
         - "NO_ASSIGNMENT" if all alerts expired/declined
         """
         # Check if has active assignment
-        try:
-            assignment = obj.guard_assignments.get(is_active=True)
+        assignment = active_guard_assignment(obj)
+        if assignment is not None:
             return {
                 'status': 'GUARD_ASSIGNED',
                 'message': 'Guard has been assigned to your incident',
                 'assigned_at': assignment.assigned_at
             }
-        except GuardAssignment.DoesNotExist:
-            pass
         
         # Check if alerts are still pending
-        pending_alerts = obj.guard_alerts.filter(
-            status__in=['SENT', 'ACCEPTED']
-        ).count()
+        pending_alerts = sum(
+            1 for alert in ordered_guard_alerts(obj)
+            if alert.status in (GuardAlert.AlertStatus.SENT, GuardAlert.AlertStatus.ACCEPTED)
+        )
         
         if pending_alerts > 0:
             return {
@@ -304,36 +346,39 @@ class IncidentStatusUpdateSerializer(serializers.ModelSerializer):
     
     def get_guard_assignment(self, obj):
         """Get active guard assignment details."""
-        try:
-            assignment = obj.guard_assignments.get(is_active=True)
-            return {
-                'id': assignment.id,
-                'guard': {
-                    'id': str(assignment.guard.id),
-                    'full_name': assignment.guard.full_name,
-                    'email': assignment.guard.email,
-                    'phone': assignment.guard.phone_number
-                },
-                'assigned_at': assignment.assigned_at,
-                'status': 'ACTIVE'
-            }
-        except GuardAssignment.DoesNotExist:
+        assignment = active_guard_assignment(obj)
+        if assignment is None:
             return None
+        return {
+            'id': assignment.id,
+            'guard': {
+                'id': str(assignment.guard.id),
+                'full_name': assignment.guard.full_name,
+                'email': assignment.guard.email,
+                'phone': assignment.guard.phone_number
+            },
+            'assigned_at': assignment.assigned_at,
+            'status': 'ACTIVE'
+        }
     
     def get_alert_status_summary(self, obj):
         """Summary of alert statuses."""
-        alerts = obj.guard_alerts.all()
+        alerts = ordered_guard_alerts(obj)
+        statuses = GuardAlert.AlertStatus
         return {
-            'total_alerts': alerts.count(),
-            'sent': alerts.filter(status='SENT').count(),
-            'accepted': alerts.filter(status='ACCEPTED').count(),
-            'declined': alerts.filter(status='DECLINED').count(),
-            'expired': alerts.filter(status='EXPIRED').count()
+            'total_alerts': len(alerts),
+            'sent': sum(1 for alert in alerts if alert.status == statuses.SENT),
+            'accepted': sum(1 for alert in alerts if alert.status == statuses.ACCEPTED),
+            'declined': sum(1 for alert in alerts if alert.status == statuses.DECLINED),
+            'expired': sum(1 for alert in alerts if alert.status == statuses.EXPIRED)
         }
     
     def get_pending_alerts(self, obj):
         """List of pending (SENT) alerts with guard info."""
-        pending = obj.guard_alerts.filter(status='SENT').order_by('priority_rank')
+        pending = [
+            alert for alert in ordered_guard_alerts(obj)
+            if alert.status == GuardAlert.AlertStatus.SENT
+        ]
         return [
             {
                 'id': alert.id,
@@ -417,7 +462,7 @@ class IncidentTimelineSerializer(serializers.ModelSerializer):
     """
     
     beacon = BeaconSerializer(read_only=True)
-    events = IncidentEventSerializer(many=True, read_only=True)
+    events = serializers.SerializerMethodField()
     current_assignment = serializers.SerializerMethodField()
     resolution_info = serializers.SerializerMethodField()
     
@@ -432,21 +477,24 @@ class IncidentTimelineSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'created_at', 'updated_at', 'resolved_at')
     
+    def get_events(self, obj):
+        events = ordered_related(obj, 'events', '-created_at')
+        return IncidentEventSerializer(events, many=True, context=self.context).data
+
     def get_current_assignment(self, obj):
         """Get active guard assignment info."""
-        try:
-            assignment = obj.guard_assignments.get(is_active=True)
-            return {
-                'guard': {
-                    'id': str(assignment.guard.id),
-                    'full_name': assignment.guard.full_name,
-                    'email': assignment.guard.email,
-                    'phone': assignment.guard.phone_number
-                },
-                'assigned_at': assignment.assigned_at
-            }
-        except GuardAssignment.DoesNotExist:
+        assignment = active_guard_assignment(obj)
+        if assignment is None:
             return None
+        return {
+            'guard': {
+                'id': str(assignment.guard.id),
+                'full_name': assignment.guard.full_name,
+                'email': assignment.guard.email,
+                'phone': assignment.guard.phone_number
+            },
+            'assigned_at': assignment.assigned_at
+        }
     
     def get_resolution_info(self, obj):
         """Get resolution details if incident is resolved."""
@@ -495,20 +543,23 @@ class GuardIncidentHistorySerializer(serializers.ModelSerializer):
         if not guard:
             return None
         
+        # The guard's assignments and alerts, prefetched by the history view
+        assignments = getattr(obj, 'history_guard_assignments', None)
+        if assignments is None:
+            assignments = list(obj.guard_assignments.filter(guard=guard))
+        alerts = getattr(obj, 'history_guard_alerts', None)
+        if alerts is None:
+            alerts = list(obj.guard_alerts.filter(guard=guard)[:1])
+        
         # Check if guard was assigned
-        try:
-            assignment = obj.guard_assignments.get(guard=guard)
-            if assignment.is_active:
+        if assignments:
+            if any(assignment.is_active for assignment in assignments):
                 return 'currently_assigned'
             return 'was_assigned'
-        except GuardAssignment.DoesNotExist:
-            pass
         
         # Check guard's alert status
-        alerts = obj.guard_alerts.filter(guard=guard)
-        if alerts.exists():
-            alert = alerts.first()
-            return f'alert_{alert.status.lower()}'
+        if alerts:
+            return f'alert_{alerts[0].status.lower()}'
         
         return None
 
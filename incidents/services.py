@@ -3,16 +3,23 @@ Incident deduplication and guard alert service.
 Core logic for beacon-centric incident management.
 """
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import timedelta
+from django.core.cache import cache
 from django.utils import timezone
 from django.db import transaction
 from .models import Incident, IncidentSignal, Beacon, IncidentEvent
+from .signals import BEACON_LOOKUP_CACHE_TIMEOUT, beacon_lookup_cache_key, get_active_beacon_pk
 from security.models import GuardAlert, GuardAssignment
 from chat.models import Conversation
 from accounts.push_notifications import PushNotificationService
 
 logger = logging.getLogger(__name__)
 
+# Per-thread buffer used by batched_incident_events()
+_event_buffer = threading.local()
+
 
 def log_incident_event(
     incident,
@@ -43,18 +50,25 @@ def log_incident_event(
         IncidentEvent: Created event instance
     """
     try:
-        event = IncidentEvent.objects.create(
+        event = IncidentEvent(
             incident=incident,
             event_type=event_type,
             actor=actor,
             target_guard=target_guard,
-            previous_status=previous_status or '',
-            new_status=new_status or '',
+            previous_status_code=IncidentEvent.status_code(previous_status),
+            new_status_code=IncidentEvent.status_code(new_status),
             previous_priority=previous_priority,
             new_priority=new_priority,
             details=details or {}
         )
         
+        buffered = getattr(_event_buffer, 'events', None)
+        if buffered is not None:
+            # Saved by batched_incident_events() on exit
+            buffered.append(event)
+        else:
+            event.save()
+        
         logger.info(
             f"[EVENT] {event_type} logged for incident {str(incident.id)[:8]}...",
             extra={'incident_id': str(incident.id), 'event_type': event_type}
@@ -66,6 +80,39 @@ def log_incident_event(
         return None
 
 
+@contextmanager
+def batched_incident_events():
+    """
+    Buffer log_incident_event() calls and insert them with one bulk_create.
+    
+    The insert runs on exit, after the surrounding transaction commits if
+    there is one. Events logged inside the block are returned unsaved.
+    Nested blocks join the outermost one. Like log_incident_event(), a
+    failed insert is logged rather than raised, so it can never replace
+    an exception raised inside the block.
+    """
+    if getattr(_event_buffer, 'events', None) is not None:
+        yield
+        return
+    
+    _event_buffer.events = events = []
+    try:
+        yield
+    finally:
+        _event_buffer.events = None
+        # Also on error: events already logged describe pushes already sent
+        if events:
+            transaction.on_commit(lambda: _save_buffered_events(events))
+
+
+def _save_buffered_events(events):
+    """Insert events collected by batched_incident_events()."""
+    try:
+        IncidentEvent.objects.bulk_create(events, batch_size=100)
+    except Exception as e:
+        logger.error(f"[EVENT] Failed to log {len(events)} buffered events: {e}")
+
+
 # =============================================================================
 # STATE MACHINE FOR INCIDENT STATUS TRANSITIONS
 # =============================================================================
@@ -208,10 +255,9 @@ def get_or_create_incident_with_signals(
             }
         )
     else:
-        # Real hardware beacon
-        try:
-            beacon = Beacon.objects.get(beacon_id=beacon_id, is_active=True)
-        except Beacon.DoesNotExist:
+        # Real hardware beacon; the pk is cached, the row is loaded under lock below
+        beacon_pk = get_active_beacon_pk(beacon_id)
+        if beacon_pk is None:
             raise ValueError(f"Invalid or inactive beacon: {beacon_id}")
     
     # 2. Try to find existing active incident within dedup window
@@ -221,8 +267,21 @@ def get_or_create_incident_with_signals(
         # Lock beacon to prevent concurrent incident creation
         # This ensures only one process can check/create incident for this beacon at a time
         if not beacon_id.startswith('location:'):
-            # For real beacons, lock the beacon row
-            Beacon.objects.select_for_update().get(id=beacon.id)
+            # For real beacons, lock the beacon row (re-checking the cached pk)
+            beacon = Beacon.objects.select_for_update().filter(
+                id=beacon_pk, beacon_id=beacon_id, is_active=True
+            ).first()
+            if beacon is None:
+                # The cached pk is stale (the cache is per process and other
+                # workers' writes don't clear it): look the beacon up directly
+                key = beacon_lookup_cache_key(beacon_id)
+                cache.delete(key)
+                beacon = Beacon.objects.select_for_update().filter(
+                    beacon_id=beacon_id, is_active=True
+                ).first()
+                if beacon is None:
+                    raise ValueError(f"Invalid or inactive beacon: {beacon_id}")
+                cache.set(key, beacon.pk, BEACON_LOOKUP_CACHE_TIMEOUT)
         
         # Lock for atomic operation
         existing_incident = Incident.objects.select_for_update().filter(
@@ -252,11 +311,18 @@ def get_or_create_incident_with_signals(
                 new_signal_type=signal_type
             )
             
-            if new_priority > existing_incident.priority:
-                old_priority = existing_incident.priority
+            old_priority = existing_incident.priority
+            escalated = new_priority > old_priority
+            
+            # Update last signal time and any escalation in one UPDATE
+            existing_incident.last_signal_time = signal.created_at
+            update_fields = ['last_signal_time']
+            if escalated:
                 existing_incident.priority = new_priority
-                existing_incident.save(update_fields=['priority'])
-                
+                update_fields.append('priority')
+            existing_incident.save(update_fields=update_fields)
+            
+            if escalated:
                 # Send INCIDENT_ESCALATED notification to assigned guard (if any)
                 try:
                     assignment = existing_incident.guard_assignments.filter(is_active=True).first()
@@ -285,10 +351,6 @@ def get_or_create_incident_with_signals(
                         extra={'incident_id': str(existing_incident.id)}
                     )
             
-            # Update last signal time
-            existing_incident.last_signal_time = timezone.now()
-            existing_incident.save(update_fields=['last_signal_time'])
-            
             logger.info(
                 f"[DEDUP] Added signal {signal_type} to existing incident {existing_incident.id}",
                 extra={'beacon_id': str(beacon.id), 'incident_id': str(existing_incident.id)}
@@ -474,95 +536,96 @@ def send_push_notifications_for_alerts(incident, guard_alerts):
     success_count = 0
     fail_count = 0
     
-    # Send notifications to each guard
-    for alert in guard_alerts:
-        guard_user = alert.guard
+    # Send notifications to each guard; their events are inserted together
+    with batched_incident_events():
+        for alert in guard_alerts:
+            guard_user = alert.guard
         
-        try:
-            # Get all active device tokens for this guard
-            tokens = PushNotificationService.get_guard_tokens(guard_user)
+            try:
+                # Get all active device tokens for this guard
+                tokens = PushNotificationService.get_guard_tokens(guard_user)
             
-            if not tokens:
-                logger.warning(f"No active tokens for guard {guard_user.email}")
-                # Log event even if no tokens
-                log_incident_event(
-                    incident=incident,
-                    event_type=IncidentEvent.EventType.ALERT_FAILED,
-                    target_guard=guard_user,
-                    details={'error': 'No active push tokens', 'alert_id': alert.id}
-                )
-                fail_count += 1
-                continue
+                if not tokens:
+                    logger.warning(f"No active tokens for guard {guard_user.email}")
+                    # Log event even if no tokens
+                    log_incident_event(
+                        incident=incident,
+                        event_type=IncidentEvent.EventType.ALERT_FAILED,
+                        target_guard=guard_user,
+                        details={'error': 'No active push tokens', 'alert_id': alert.id}
+                    )
+                    fail_count += 1
+                    continue
             
-            # Get incident images if available
-            images = incident.images.all().order_by('uploaded_at')
-            image_urls = []
-            if images.exists():
-                # Get first image to include in push notification
-                # Full list of images will be available in the incident details API
-                image_urls = [
-                    img.image.url for img in images[:3]  # Include first 3 images
-                ]
+                # Get incident images if available
+                images = incident.images.all().order_by('uploaded_at')
+                image_urls = []
+                if images.exists():
+                    # Get first image to include in push notification
+                    # Full list of images will be available in the incident details API
+                    image_urls = [
+                        img.image.url for img in images[:3]  # Include first 3 images
+                    ]
             
-            # Send notification with logging and retry
-            notification_data = {
-                "type": "GUARD_ALERT",
-                "incident_id": str(incident.id),
-                "alert_id": str(alert.id),
-                "priority": priority_name,
-                "location": location,
-                "image_count": incident.images.count(),
-            }
+                # Send notification with logging and retry
+                notification_data = {
+                    "type": "GUARD_ALERT",
+                    "incident_id": str(incident.id),
+                    "alert_id": str(alert.id),
+                    "priority": priority_name,
+                    "location": location,
+                    "image_count": incident.images.count(),
+                }
             
-            # Add image URLs if available
-            if image_urls:
-                notification_data["images"] = image_urls
+                # Add image URLs if available
+                if image_urls:
+                    notification_data["images"] = image_urls
             
-            # Send to each token (usually one per device)
-            token_success = False
-            for token in tokens:
-                success = PushNotificationService.send_with_logging(
-                    recipient=guard_user,
-                    expo_token=token,
-                    notification_type='GUARD_ALERT',
-                    title="🚨 Incoming Alert",
-                    body=f"{priority_name} - {location}",
-                    data=notification_data,
-                    incident=incident,
-                    guard_alert=alert,
-                    max_retries=3
-                )
-                if success:
-                    token_success = True
+                # Send to each token (usually one per device)
+                token_success = False
+                for token in tokens:
+                    success = PushNotificationService.send_with_logging(
+                        recipient=guard_user,
+                        expo_token=token,
+                        notification_type='GUARD_ALERT',
+                        title="🚨 Incoming Alert",
+                        body=f"{priority_name} - {location}",
+                        data=notification_data,
+                        incident=incident,
+                        guard_alert=alert,
+                        max_retries=3
+                    )
+                    if success:
+                        token_success = True
             
-            if token_success:
-                # Log ALERT_SENT event
-                log_incident_event(
-                    incident=incident,
-                    event_type=IncidentEvent.EventType.ALERT_SENT,
-                    target_guard=guard_user,
-                    details={
-                        'alert_id': alert.id,
-                        'priority_rank': alert.priority_rank,
-                        'tokens_count': len(tokens),
-                        'images_sent': len(image_urls)
-                    }
-                )
-                success_count += 1
-                logger.info(f"✅ Sent push to guard {guard_user.email} for incident {str(incident.id)[:8]} with {len(image_urls)} images")
-            else:
-                # Log failure event
-                log_incident_event(
-                    incident=incident,
-                    event_type=IncidentEvent.EventType.ALERT_FAILED,
-                    target_guard=guard_user,
-                    details={'error': 'All tokens failed', 'alert_id': alert.id}
-                )
-                fail_count += 1
+                if token_success:
+                    # Log ALERT_SENT event
+                    log_incident_event(
+                        incident=incident,
+                        event_type=IncidentEvent.EventType.ALERT_SENT,
+                        target_guard=guard_user,
+                        details={
+                            'alert_id': alert.id,
+                            'priority_rank': alert.priority_rank,
+                            'tokens_count': len(tokens),
+                            'images_sent': len(image_urls)
+                        }
+                    )
+                    success_count += 1
+                    logger.info(f"✅ Sent push to guard {guard_user.email} for incident {str(incident.id)[:8]} with {len(image_urls)} images")
+                else:
+                    # Log failure event
+                    log_incident_event(
+                        incident=incident,
+                        event_type=IncidentEvent.EventType.ALERT_FAILED,
+                        target_guard=guard_user,
+                        details={'error': 'All tokens failed', 'alert_id': alert.id}
+                    )
+                    fail_count += 1
                 
-        except Exception as e:
-            logger.error(f"❌ Failed to send notification to guard {guard_user.email}: {e}", exc_info=True)
-            fail_count += 1
+            except Exception as e:
+                logger.error(f"❌ Failed to send notification to guard {guard_user.email}: {e}", exc_info=True)
+                fail_count += 1
     
     logger.info(f"[PUSH] Push notification summary: {success_count} success, {fail_count} failed")
 
@@ -718,7 +781,7 @@ def update_buzzer_status_on_incident_created(incident):
         incident: Incident instance (just created)
     """
     incident.buzzer_status = Incident.BuzzerStatus.PENDING
-    incident.save(update_fields=['buzzer_status', 'buzzer_last_updated'])
+    incident.save(update_fields=['buzzer_status'])
     
     logger.info(
         f"[BUZZER] Set status to PENDING for incident {str(incident.id)[:8]}",
@@ -736,7 +799,7 @@ def update_buzzer_status_on_guard_assignment(incident, guard):
         guard: User instance (guard who was assigned)
     """
     incident.buzzer_status = Incident.BuzzerStatus.ACTIVE
-    incident.save(update_fields=['buzzer_status', 'buzzer_last_updated'])
+    incident.save(update_fields=['buzzer_status'])
     
     logger.info(
         f"[BUZZER] Set status to ACTIVE for incident {str(incident.id)[:8]} (Guard: {guard.full_name})",
@@ -753,7 +816,7 @@ def update_buzzer_status_on_incident_acknowledged(incident):
         incident: Incident instance
     """
     incident.buzzer_status = Incident.BuzzerStatus.ACKNOWLEDGED
-    incident.save(update_fields=['buzzer_status', 'buzzer_last_updated'])
+    incident.save(update_fields=['buzzer_status'])
     
     logger.info(
         f"[BUZZER] Set status to ACKNOWLEDGED for incident {str(incident.id)[:8]}",
@@ -770,7 +833,7 @@ def update_buzzer_status_on_incident_resolved(incident):
         incident: Incident instance
     """
     incident.buzzer_status = Incident.BuzzerStatus.RESOLVED
-    incident.save(update_fields=['buzzer_status', 'buzzer_last_updated'])
+    incident.save(update_fields=['buzzer_status'])
     
     logger.info(
         f"[BUZZER] Set status to RESOLVED for incident {str(incident.id)[:8]}",
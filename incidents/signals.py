@@ -0,0 +1,112 @@
+"""
+Signal handlers for the incidents app.
+
+Keeps short-lived caches derived from incident state in step with the
+database.
+"""
+
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Beacon, Incident, IncidentSignal
+
+
+# The default cache is per process: the Incident receiver below clears the
+# entry only in the worker that saved the incident, so the admin in other
+# workers can show the old buzzer state for up to this long
+BUZZER_CACHE_TIMEOUT = 10  # seconds
+BEACON_LOOKUP_CACHE_TIMEOUT = 3600  # seconds
+
+
+def beacon_buzzer_cache_key(beacon_pk):
+    """Cache key for a beacon's computed buzzer ON/OFF state."""
+    return f'beacon-buzzer:{beacon_pk}'
+
+
+def beacon_lookup_cache_key(beacon_id):
+    """Cache key for the pk of the active beacon with a hardware beacon_id."""
+    return f'beacon-lookup:{beacon_id}'
+
+
+def get_active_beacon_pk(beacon_id):
+    """
+    Pk of the active beacon with this hardware beacon_id, or None.
+    
+    The default cache is per process, so another worker may still hold a
+    pk for a beacon that has since been renamed or deactivated. Callers
+    must re-check the row they load with it.
+    """
+    key = beacon_lookup_cache_key(beacon_id)
+    beacon_pk = cache.get(key)
+    if beacon_pk is None:
+        beacon_pk = (
+            Beacon.objects.filter(beacon_id=beacon_id, is_active=True)
+            .values_list('pk', flat=True)
+            .first()
+        )
+        # Misses aren't cached so a newly registered beacon is found right away
+        if beacon_pk is not None:
+            cache.set(key, beacon_pk, BEACON_LOOKUP_CACHE_TIMEOUT)
+    return beacon_pk
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def invalidate_beacon_buzzer_cache(sender, instance, **kwargs):
+    """Drop this process's cached buzzer state for the incident's beacon."""
+    if instance.beacon_id:
+        cache.delete(beacon_buzzer_cache_key(instance.beacon_id))
+
+
+@receiver(post_save, sender=Beacon)
+def sync_incident_beacon_search(sender, instance, created, **kwargs):
+    """Refresh Incident's beacon-derived columns when a beacon's id or name changes."""
+    if created:
+        return
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not {'beacon_id', 'location_name'} & set(update_fields):
+        return
+    text = Incident.build_beacon_search(instance)
+    location = instance.location_name
+    Incident.objects.filter(beacon=instance).exclude(
+        beacon_search=text, beacon_location_cache=location
+    ).update(beacon_search=text, beacon_location_cache=location)
+
+
+@receiver(post_save, sender=Beacon)
+@receiver(post_delete, sender=Beacon)
+def invalidate_beacon_lookup_cache(sender, instance, **kwargs):
+    """Drop the cached pk for the beacon's hardware id."""
+    # A renamed beacon leaves its old key behind; callers re-check the
+    # beacon_id when they load the row and drop the entry themselves
+    cache.delete(beacon_lookup_cache_key(instance.beacon_id))
+
+
+def _adjust_signal_count(incident_pk, delta):
+    """Add delta to an incident's signal_count with a single UPDATE."""
+    queryset = Incident.objects.filter(pk=incident_pk)
+    if delta < 0:
+        queryset = queryset.filter(signal_count__gte=-delta)
+    queryset.update(signal_count=F('signal_count') + delta)
+
+
+@receiver(post_save, sender=IncidentSignal)
+def count_incident_signal(sender, instance, created, **kwargs):
+    """Count a new signal on its incident, or move it when reassigned."""
+    if created:
+        _adjust_signal_count(instance.incident_id, 1)
+    else:
+        # IncidentSignal.from_db() snapshots the incident the row was loaded with
+        previous = getattr(instance, '_saved_incident_id', None)
+        if previous is not None and previous != instance.incident_id:
+            _adjust_signal_count(previous, -1)
+            _adjust_signal_count(instance.incident_id, 1)
+    instance._saved_incident_id = instance.incident_id
+
+
+@receiver(post_delete, sender=IncidentSignal)
+def uncount_incident_signal(sender, instance, **kwargs):
+    """Uncount a deleted signal on its incident."""
+    _adjust_signal_count(instance.incident_id, -1)
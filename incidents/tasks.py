@@ -0,0 +1,79 @@
+"""
+Background jobs for the incidents app.
+
+The deployment has no task queue, so these run on a small in-process
+thread pool, started once the surrounding transaction has committed.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, transaction
+
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='incidents-bg')
+
+# Waits between blob.exists() checks while a fresh upload becomes visible
+MAKE_PUBLIC_RETRY_DELAYS = (0.5, 1, 2)
+
+
+def make_blob_public(bucket, blob_name, label):
+    """Grant public read on a GCS blob, retrying while it isn't visible yet."""
+    try:
+        blob = bucket.blob(blob_name)
+        for delay in (0, *MAKE_PUBLIC_RETRY_DELAYS):
+            time.sleep(delay)
+            if blob.exists():
+                blob.make_public()
+                logger.info(f"✓ {label} made public: gs://{bucket.name}/{blob_name}")
+                return True
+        logger.warning(f"⚠ {label} blob not found after retries: {blob_name}")
+    except Exception as e:
+        logger.error(f"✗ Could not make {label} public: {type(e).__name__}: {e}")
+    return False
+
+
+def make_public_on_commit(field_file, label):
+    """Queue make_blob_public for a stored file once the transaction commits."""
+    if settings.GCS_BUCKET_PUBLIC_READ:
+        # Bucket-level IAM already grants public read
+        return
+    try:
+        bucket = getattr(field_file.storage, 'bucket', None)
+    except Exception as e:
+        # Log but don't fail - the file is already saved to storage
+        logger.error(f"✗ Could not reach storage bucket for {label}: {type(e).__name__}: {e}")
+        return
+    if bucket is None:
+        logger.debug(f"{label} not using GCS backend (local storage)")
+        return
+    blob_name = field_file.name
+    transaction.on_commit(
+        lambda: _executor.submit(make_blob_public, bucket, blob_name, label)
+    )
+
+
+def build_image_thumbnail(image_pk):
+    """Create the thumbnail of an IncidentImage that doesn't have one yet."""
+    from .models import IncidentImage
+    try:
+        image = IncidentImage.objects.filter(pk=image_pk).first()
+        if image is not None and image.image and not image.thumbnail:
+            image.create_thumbnail()
+    except Exception as e:
+        logger.error(f"✗ Thumbnail job failed for image {image_pk}: {type(e).__name__}: {e}")
+    finally:
+        # Worker threads open their own connection; don't leave it dangling
+        connection.close()
+
+
+def create_thumbnail_on_commit(image):
+    """Queue build_image_thumbnail for a saved image once the transaction commits."""
+    image_pk = image.pk
+    transaction.on_commit(
+        lambda: _executor.submit(build_image_thumbnail, image_pk)
+    )
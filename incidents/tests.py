@@ -1,3 +1,277 @@
-from django.test import TestCase
+from datetime import timedelta
+from importlib import import_module
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.db import DatabaseError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from .models import Beacon, Incident, IncidentEvent, IncidentSignal
+from .services import _event_buffer, batched_incident_events, log_incident_event
+
+
+class IncidentSignalCountTests(TestCase):
+    def setUp(self):
+        self.beacon = Beacon.objects.create(beacon_id='test-beacon-1', uuid='uuid', major=1, minor=1, location_name='Test Hall', building='Main', floor=1, is_active=True)
+        self.incident = Incident.objects.create(beacon=self.beacon)
+        self.other_incident = Incident.objects.create(beacon=self.beacon)
+
+    def add_signal(self, incident):
+        return IncidentSignal.objects.create(incident=incident, signal_type=IncidentSignal.SignalType.STUDENT_SOS)
+
+    def assertSignalCount(self, incident, expected):
+        incident.refresh_from_db(fields=['signal_count'])
+        self.assertEqual(incident.signal_count, expected)
+
+    def test_create_counts_signal(self):
+        self.add_signal(self.incident)
+        self.add_signal(self.incident)
+        self.assertSignalCount(self.incident, 2)
+        self.assertSignalCount(self.other_incident, 0)
+
+    def test_resave_does_not_count_again(self):
+        signal = self.add_signal(self.incident)
+        signal.details = {'description': 'updated'}
+        signal.save()
+        IncidentSignal.objects.get(pk=signal.pk).save()
+        self.assertSignalCount(self.incident, 1)
+
+    def test_reassign_moves_count(self):
+        self.add_signal(self.incident)
+        signal = IncidentSignal.objects.get(pk=self.add_signal(self.incident).pk)
+        signal.incident = self.other_incident
+        signal.save()
+        self.assertSignalCount(self.incident, 1)
+        self.assertSignalCount(self.other_incident, 1)
+
+    def test_reassign_after_create_moves_count(self):
+        signal = self.add_signal(self.incident)
+        signal.incident = self.other_incident
+        signal.save()
+        self.assertSignalCount(self.incident, 0)
+        self.assertSignalCount(self.other_incident, 1)
+
+    def test_delete_uncounts_signal(self):
+        signal = self.add_signal(self.incident)
+        self.add_signal(self.incident)
+        signal.delete()
+        self.assertSignalCount(self.incident, 1)
+
+        IncidentSignal.objects.filter(incident=self.incident).delete()
+        self.assertSignalCount(self.incident, 0)
+
+    def test_backfill_migration(self):
+        for _ in range(3):
+            self.add_signal(self.incident)
+        self.add_signal(self.other_incident)
+        Incident.objects.update(signal_count=0)
+
+        migration = import_module('incidents.migrations.0031_incident_signal_count')
+        migration.backfill_signal_count(apps, None)
+
+        self.assertSignalCount(self.incident, 3)
+        self.assertSignalCount(self.other_incident, 1)
+
+
+class IncidentBuzzerLastUpdatedTests(TestCase):
+    def setUp(self):
+        beacon = Beacon.objects.create(beacon_id='test-beacon-1', uuid='uuid', major=1, minor=1, location_name='Test Hall', building='Main', floor=1, is_active=True)
+        incident = Incident.objects.create(beacon=beacon)
+        self.stamp = timezone.now() - timedelta(hours=1)
+        Incident.objects.filter(pk=incident.pk).update(buzzer_last_updated=self.stamp)
+        self.incident = Incident.objects.get(pk=incident.pk)
+
+    def stored_stamp(self):
+        return Incident.objects.values_list('buzzer_last_updated', flat=True).get(pk=self.incident.pk)
+
+    def test_create_stamps(self):
+        self.assertIsNotNone(Incident.objects.create(beacon=self.incident.beacon).buzzer_last_updated)
+
+    def test_save_without_change_keeps_stamp(self):
+        self.incident.description = 'updated'
+        self.incident.save()
+        self.assertEqual(self.stored_stamp(), self.stamp)
+
+    def test_save_with_change_stamps(self):
+        self.incident.buzzer_status = Incident.BuzzerStatus.PENDING
+        self.incident.save()
+        self.assertGreater(self.stored_stamp(), self.stamp)
+
+        # The new status is the baseline for the next save
+        self.incident.save()
+        self.assertEqual(self.stored_stamp(), self.incident.buzzer_last_updated)
+
+    def test_update_fields_with_buzzer_status_stamps(self):
+        self.incident.buzzer_status = Incident.BuzzerStatus.PENDING
+        self.incident.save(update_fields=['buzzer_status'])
+        self.assertGreater(self.stored_stamp(), self.stamp)
+
+    def test_update_fields_without_buzzer_status_keeps_stamp(self):
+        self.incident.buzzer_status = Incident.BuzzerStatus.PENDING
+        self.incident.status = Incident.Status.ASSIGNED
+        self.incident.save(update_fields=['status'])
+        self.assertEqual(self.stored_stamp(), self.stamp)
+
+        # buzzer_status was not saved, so it still counts as changed
+        self.incident.save(update_fields=['buzzer_status'])
+        self.assertGreater(self.stored_stamp(), self.stamp)
+
+    def test_deferred_buzzer_status_keeps_stamp(self):
+        incident = Incident.objects.defer('buzzer_status').get(pk=self.incident.pk)
+        incident.status = Incident.Status.ASSIGNED
+        with self.assertNumQueries(1):
+            incident.save(update_fields=['status'])
+        self.assertEqual(self.stored_stamp(), self.stamp)
+
+
+class IncidentEventStatusCodeTests(TestCase):
+    def test_status_codes_match_incident_statuses(self):
+        self.assertEqual(IncidentEvent.StatusCode.names, Incident.Status.values)
+        self.assertEqual(IncidentEvent.StatusCode.labels, Incident.Status.labels)
+
+    def test_status_code(self):
+        for status in Incident.Status:
+            code = IncidentEvent.status_code(status)
+            self.assertEqual(code.name, status.value)
+            self.assertEqual(code.label, status.label)
+        self.assertEqual(IncidentEvent.status_code('IN_PROGRESS'), IncidentEvent.StatusCode.IN_PROGRESS)
+        self.assertIsNone(IncidentEvent.status_code(None))
+        self.assertIsNone(IncidentEvent.status_code(''))
+
+    def test_status_properties(self):
+        event = IncidentEvent(
+            previous_status_code=IncidentEvent.StatusCode.ASSIGNED,
+            new_status_code=IncidentEvent.StatusCode.RESOLVED,
+        )
+        self.assertEqual(event.previous_status, Incident.Status.ASSIGNED)
+        self.assertEqual(event.new_status, Incident.Status.RESOLVED)
+
+        event = IncidentEvent()
+        self.assertEqual(event.previous_status, '')
+        self.assertEqual(event.new_status, '')
+
+
+class IncidentEventStatusCodeMigrationTests(TransactionTestCase):
+    migrate_from = [('incidents', '0026_incident_guard_resolver_indexes')]
+    migrate_to = [('incidents', '0027_incidentevent_status_codes')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def create_events(self, old_apps, transitions):
+        Beacon = old_apps.get_model('incidents', 'Beacon')
+        Incident = old_apps.get_model('incidents', 'Incident')
+        IncidentEvent = old_apps.get_model('incidents', 'IncidentEvent')
+        beacon = Beacon.objects.create(beacon_id='test-beacon-1', uuid='uuid', major=1, minor=1, location_name='Test Hall', building='Main', floor=1, is_active=True)
+        incident = Incident.objects.create(beacon=beacon)
+        return [
+            IncidentEvent.objects.create(
+                incident=incident,
+                event_type='STATUS_CHANGED',
+                previous_status=previous_status,
+                new_status=new_status,
+            ).pk
+            for previous_status, new_status in transitions
+        ]
+
+    def test_forward_and_reverse(self):
+        transitions = [
+            ('CREATED', 'ASSIGNED'),
+            ('ASSIGNED', 'IN_PROGRESS'),
+            ('IN_PROGRESS', 'RESOLVED'),
+            ('', ''),
+        ]
+        old_apps = self.migrate(self.migrate_from)
+        pks = self.create_events(old_apps, transitions)
+
+        new_apps = self.migrate(self.migrate_to)
+        IncidentEvent = new_apps.get_model('incidents', 'IncidentEvent')
+        codes = {
+            pk: (previous_code, new_code)
+            for pk, previous_code, new_code in IncidentEvent.objects.values_list('pk', 'previous_status_code', 'new_status_code')
+        }
+        self.assertEqual(codes, {
+            pks[0]: (1, 2),
+            pks[1]: (2, 3),
+            pks[2]: (3, 4),
+            pks[3]: (None, None),
+        })
+
+        old_apps = self.migrate(self.migrate_from)
+        IncidentEvent = old_apps.get_model('incidents', 'IncidentEvent')
+        statuses = {
+            pk: (previous_status, new_status)
+            for pk, previous_status, new_status in IncidentEvent.objects.values_list('pk', 'previous_status', 'new_status')
+        }
+        self.assertEqual(statuses, dict(zip(pks, transitions)))
+
+
+class BatchedIncidentEventsTests(TestCase):
+    def setUp(self):
+        beacon = Beacon.objects.create(beacon_id='test-beacon-1', uuid='uuid', major=1, minor=1, location_name='Test Hall', building='Main', floor=1, is_active=True)
+        self.incident = Incident.objects.create(beacon=beacon)
+
+    def log(self, event_type):
+        return log_incident_event(self.incident, event_type)
+
+    def stored_event_types(self):
+        return list(IncidentEvent.objects.order_by('pk').values_list('event_type', flat=True))
+
+    def test_events_saved_once_in_order(self):
+        event_types = [
+            IncidentEvent.EventType.ALERT_SENT,
+            IncidentEvent.EventType.ALERT_DELIVERED,
+            IncidentEvent.EventType.ALERT_FAILED,
+        ]
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with batched_incident_events():
+                for event_type in event_types:
+                    self.log(event_type)
+                # Nested blocks join the outer one
+                with batched_incident_events():
+                    self.log(IncidentEvent.EventType.ALERT_EXPIRED)
+                self.assertEqual(self.stored_event_types(), [])
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.stored_event_types(), [*event_types, IncidentEvent.EventType.ALERT_EXPIRED])
+
+    def test_exception_leaves_buffer_clean(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ValueError):
+                with batched_incident_events():
+                    self.log(IncidentEvent.EventType.ALERT_SENT)
+                    raise ValueError
+
+        self.assertIsNone(_event_buffer.events)
+        # Events logged before the error are still saved
+        self.assertEqual(self.stored_event_types(), [IncidentEvent.EventType.ALERT_SENT])
+
+        self.log(IncidentEvent.EventType.ALERT_DELIVERED)
+        self.assertEqual(self.stored_event_types(), [
+            IncidentEvent.EventType.ALERT_SENT,
+            IncidentEvent.EventType.ALERT_DELIVERED,
+        ])
+
+    def test_empty_block_saves_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with batched_incident_events():
+                pass
+        self.assertEqual(callbacks, [])
+
+    def test_failed_insert_is_logged(self):
+        with mock.patch.object(IncidentEvent.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            with self.assertLogs('incidents.services', level='ERROR') as logs:
+                with self.captureOnCommitCallbacks(execute=True):
+                    with batched_incident_events():
+                        self.log(IncidentEvent.EventType.ALERT_SENT)
+
+        self.assertIn('Failed to log 1 buffered events', logs.output[0])
+        self.assertIsNone(_event_buffer.events)
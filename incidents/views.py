@@ -3,6 +3,7 @@ ViewSets for unified incident management.
 """
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.http import JsonResponse
@@ -35,6 +36,16 @@ class BeaconViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
 
 
+class IncidentCursorPagination(CursorPagination):
+    """
+    Newest-first keyset pagination for the incident list.
+    
+    Pages seek from the last created_at seen instead of using OFFSET, so
+    deep pages cost the same as the first.
+    """
+    ordering = ('-created_at', '-id')
+
+
 class IncidentViewSet(viewsets.ModelViewSet):
     """
     Unified ViewSet for all incidents.
@@ -46,22 +57,22 @@ class IncidentViewSet(viewsets.ModelViewSet):
     POST   /api/incidents/{id}/resolve/ - Mark as RESOLVED
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = IncidentCursorPagination
     
     def get_queryset(self):
         user = self.request.user
+        if self.action == 'list':
+            # IncidentListSerializer reads a few columns and two counts
+            queryset = Incident.objects.for_list()
+        else:
+            queryset = Incident.objects.with_relations()
         
         # Students see only incidents they were involved in
         if user.role == 'STUDENT':
-            return Incident.objects.filter(
-                signals__source_user=user
-            ).distinct().prefetch_related('signals', 'images', 'guard_assignments', 'guard_alerts', 'conversation__messages')
+            queryset = queryset.filter(signals__source_user=user).distinct()
         
-        # Guards see all incidents (for their location/nearby)
-        if user.role == 'GUARD':
-            return Incident.objects.all().prefetch_related('signals', 'images', 'guard_assignments', 'guard_alerts', 'conversation__messages')
-        
-        # Admins see all
-        return Incident.objects.all().prefetch_related('signals', 'images', 'guard_assignments', 'guard_alerts', 'conversation__messages')
+        # Guards and admins see all incidents
+        return queryset.order_by('-created_at')
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -222,7 +233,7 @@ class IncidentViewSet(viewsets.ModelViewSet):
             # Always update report_type and location fields
             incident.report_type = report_type
             incident.location = location if location else incident.beacon.location_name
-            incident.save()
+            incident.save(update_fields=['report_type', 'location', 'updated_at'])
             
         except ValueError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -436,7 +447,9 @@ class IncidentViewSet(viewsets.ModelViewSet):
         incident.resolved_at = timezone.now()
         incident.resolution_notes = resolution_notes
         incident.resolution_type = resolution_type
-        incident.save()
+        incident.save(update_fields=[
+            'status', 'resolved_by', 'resolved_at', 'resolution_notes', 'resolution_type', 'updated_at',
+        ])
         
         # Update buzzer status to RESOLVED (incident complete, stop buzzer)
         from .services import update_buzzer_status_on_incident_resolved
@@ -533,10 +546,13 @@ class IncidentViewSet(viewsets.ModelViewSet):
         GET /api/incidents/{id}/signals/
         """
         incident = self.get_object()
-        signals = incident.signals.all().order_by('-created_at')
+        from .serializers import IncidentSignalSerializer, requested_expansions
+        context = {'request': request}
+        # Devices only carry a beacon id unless ?expand=beacon
+        device = 'source_device__beacon' if 'beacon' in requested_expansions(context) else 'source_device'
+        signals = incident.signals.select_related('source_user', device).order_by('-created_at')
         
-        from .serializers import IncidentSignalSerializer
-        serializer = IncidentSignalSerializer(signals, many=True)
+        serializer = IncidentSignalSerializer(signals, many=True, context=context)
         
         return Response(serializer.data)
     
@@ -770,15 +786,13 @@ def buzzer_status_endpoint(request):
         status__in=[Incident.Status.CREATED, Incident.Status.ASSIGNED, Incident.Status.IN_PROGRESS]
     ).order_by('-created_at')
     
-    # If no active incidents, buzzer is inactive
-    if not active_incidents.exists():
+    # Buzzer status of the most recent incident; if there are no active incidents, buzzer is inactive
+    buzzer_status = active_incidents.values_list('buzzer_status', flat=True).first()
+    if buzzer_status is None:
         return JsonResponse({'incident_active': False})
     
-    # Get the most recent incident
-    incident = active_incidents.first()
-    
     # Determine if buzzer should be active
-    should_buzz = incident.buzzer_status in [
+    should_buzz = buzzer_status in [
         Incident.BuzzerStatus.PENDING,
         Incident.BuzzerStatus.ACTIVE
     ]
@@ -73,7 +73,8 @@ print(f"[INCIDENT] {incident.id}")
 print("\n[IMAGE CREATION]")
 image = PILImage.new('RGB', (640, 480), color='red')
 image_io = BytesIO()
-image.save(image_io, format='JPEG', quality=85)
+# Flat fixture image: skip the extra encoder passes, they buy nothing here
+image.save(image_io, format='JPEG', quality=40, optimize=False, progressive=False, subsampling=2)
 image_io.seek(0)
 image_io.name = 'debug_test.jpg'
 print(f"  Created: {image_io.name}")
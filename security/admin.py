@@ -5,6 +5,7 @@ from .models import GuardProfile, GuardAssignment, GuardAlert
 @admin.register(GuardProfile)
 class GuardProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'is_active', 'is_available', 'is_assigned', 'current_beacon', 'last_active_at')
+    list_select_related = ('user', 'current_beacon')
     
     @admin.display(boolean=True, description='Assigned?')
     def is_assigned(self, obj):
@@ -12,6 +13,7 @@ class GuardProfileAdmin(admin.ModelAdmin):
     list_filter = ('is_active', 'is_available', 'created_at')
     search_fields = ('user__email', 'user__full_name', 'current_beacon__location_name')
     ordering = ('-last_active_at',)
+    autocomplete_fields = ('user', 'current_beacon')
     readonly_fields = ('created_at', 'updated_at', 'last_beacon_update')
     fieldsets = (
         ('Guard Info', {'fields': ('user', 'is_active', 'is_available')}),
@@ -24,9 +26,11 @@ class GuardProfileAdmin(admin.ModelAdmin):
 @admin.register(GuardAssignment)
 class GuardAssignmentAdmin(admin.ModelAdmin):
     list_display = ('id', 'guard', 'incident', 'is_active', 'assigned_at')
+    list_select_related = ('guard', 'incident__beacon')
     list_filter = ('is_active', 'assigned_at')
     search_fields = ('guard__user__email', 'incident__id', 'incident__beacon__location_name')
     ordering = ('-assigned_at',)
+    autocomplete_fields = ('guard', 'incident')
     readonly_fields = ('id', 'assigned_at', 'updated_at')
     fieldsets = (
         ('Assignment', {'fields': ('id', 'guard', 'incident')}),
@@ -42,9 +46,11 @@ class GuardAlertAdmin(admin.ModelAdmin):
     Shows alert status, type, priority ranking, and push notification tracking.
     """
     list_display = ('id', 'incident', 'guard', 'alert_type', 'status', 'priority_rank', 'requires_response', 'alert_sent_at')
+    list_select_related = ('incident__beacon', 'guard')
     list_filter = ('status', 'alert_type', 'requires_response', 'priority_rank', 'alert_sent_at', 'incident__beacon__building')
     search_fields = ('guard__email', 'guard__full_name', 'incident__id')
     ordering = ('-alert_sent_at',)
+    autocomplete_fields = ('incident', 'guard', 'assignment')
     readonly_fields = ('id', 'alert_sent_at', 'updated_at', 'responded_at')
     fieldsets = (
         ('Alert Info', {'fields': ('id', 'incident', 'guard', 'alert_type')}),
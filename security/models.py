@@ -96,7 +96,7 @@ class GuardAssignment(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.guard.full_name} → Incident {str(self.incident.id)[:8]} (active={self.is_active})"
+        return f"{self.guard.full_name} → Incident {str(self.incident_id)[:8]} (active={self.is_active})"
 
 
 class GuardAlert(models.Model):
@@ -195,4 +195,4 @@ class GuardAlert(models.Model):
         ]
     
     def __str__(self):
-        return f"Alert[{self.alert_type}]: Guard {self.guard.full_name} → Incident {str(self.incident.id)[:8]} ({self.status})"
+        return f"Alert[{self.alert_type}]: Guard {self.guard.full_name} → Incident {str(self.incident_id)[:8]} ({self.status})"
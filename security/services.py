@@ -77,13 +77,14 @@ def find_available_guards_via_beacon_proximity(incident_beacon, max_guards=3, ex
         
         # If not enough guards found, add nearby beacons to search queue
         if len(found_guards) < max_guards:
-            nearby_beacons = BeaconProximity.objects.filter(
-                from_beacon=current_beacon
+            # Unvisited neighbors with their beacons, nearest first, in one query
+            proximities = BeaconProximity.objects.filter(
+                from_beacon_id=current_beacon.id
+            ).exclude(
+                to_beacon_id__in=visited_beacons
             ).select_related('to_beacon').order_by('priority')
-            
-            for proximity in nearby_beacons:
-                if proximity.to_beacon.id not in visited_beacons:
-                    search_queue.append((proximity.to_beacon, proximity.priority))
+            for proximity in proximities:
+                search_queue.append((proximity.to_beacon, proximity.priority))
     
     logger.info(
         f"[SEARCH] 📊 Result: found {len(found_guards)} guards for beacon {incident_beacon.location_name}"
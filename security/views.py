@@ -217,7 +217,7 @@ class GuardProfileViewSet(viewsets.ReadOnlyModelViewSet):
         """
         from incidents.models import Incident
         from incidents.serializers import GuardIncidentHistorySerializer
-        from django.db.models import Q
+        from django.db.models import Prefetch, Q
         
         guard = request.user
         
@@ -232,7 +232,13 @@ class GuardProfileViewSet(viewsets.ReadOnlyModelViewSet):
         incidents = Incident.objects.filter(
             Q(guard_assignments__guard=guard) |
             Q(guard_alerts__guard=guard)
-        ).distinct().order_by('-created_at')
+        ).distinct().select_related('beacon').prefetch_related(
+            # This guard's own rows, read by GuardIncidentHistorySerializer.get_guard_role
+            Prefetch('guard_assignments', queryset=GuardAssignment.objects.filter(guard=guard),
+                     to_attr='history_guard_assignments'),
+            Prefetch('guard_alerts', queryset=GuardAlert.objects.filter(guard=guard),
+                     to_attr='history_guard_alerts'),
+        ).order_by('-created_at')
         
         # Apply filters
         incident_status = request.query_params.get('status')